@@ -18,21 +18,77 @@ Usage:
 2. Call submit_observations() for each XML document (returns immediately)
 """
 
-import queue
+import collections
+import io
+import json
+import random
+import re
+import sys
 import threading
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Callable, Any, Tuple, Union
 from dataclasses import dataclass
 import requests
 
+try:
+    # Optional C-level parser; falls back to xml.etree when not installed
+    from lxml import etree as _lxml_etree
+except ImportError:
+    _lxml_etree = None
+
+try:
+    # Optional C-level JSON encoder; falls back to the stdlib json module
+    import orjson as _orjson
+except ImportError:
+    _orjson = None  # type: ignore[assignment]
+
 
 # Constants
 DEFAULT_BATCH_SIZE = 500
 DEFAULT_QUEUE_CAPACITY = 10000
+DEFAULT_WORKER_COUNT = 2
+MAX_DRAIN_SIZE = 100  # Work items taken from the queue per worker wakeup
+SHED_WATERMARK = 0.8  # Queue fill above which submissions are randomly sampled out
 OBSERVATIONS_ENDPOINT = "/catalog/contexts/{}/observations"
 
+# lxml parser settings: never resolve entities, and drop comments/PIs so elements are
+# the only children (processed elements are detached by position). recover stays off
+# so malformed XML yields no observations, same as ElementTree.
+_LXML_ITERPARSE_OPTIONS: Dict[str, Any] = {
+    "events": ("start", "end"),
+    "resolve_entities": False,
+    "remove_comments": True,
+    "remove_pis": True,
+    "huge_tree": False,
+}
+
+# Field statistics are tracked as [total, null, empty] counters per field path,
+# avoiding a per-path object while parsing
+_TOTAL_OCCURRENCES = 0
+_NULL_VALUE_COUNT = 1
+_EMPTY_VALUE_COUNT = 2
+
+# Field path separators for child elements and attributes
+_ELEMENT_SEPARATOR = "/"
+_ATTRIBUTE_SEPARATOR = "/@"
+
+# Upper bound on cached field paths before the cache is discarded and rebuilt
+_PATH_CACHE_MAX_SIZE = 4096
+
+# Upper bound on cached per-context endpoint URLs
+_URL_CACHE_MAX_SIZE = 256
+
+# Inputs up to this length are parsed into a tree with ElementTree's C parser and walked,
+# which measures roughly twice as fast as streaming parse events through Python; larger
+# inputs are streamed so memory stays bounded by document depth
+_TREE_PARSE_MAX_SIZE = 1024 * 1024
+
+# Input is fed to the pull parser in slices of this size so events can be consumed
+# (and elements released) before the whole document has been tokenized
+_PARSE_CHUNK_SIZE = 64 * 1024
+
 
-@dataclass
+@dataclass(slots=True)
 class CatalogObservationDto:
     """
     Represents a field observation for the Ceremony Field Catalog API.
@@ -55,23 +111,95 @@ class CatalogObservationDto:
         }
 
 
-@dataclass
-class FieldStatistics:
-    """Internal class for tracking field statistics during XML parsing."""
-    field_path: str
-    metadata: Dict[str, str]
-    total_occurrences: int = 0
-    null_value_count: int = 0
-    empty_value_count: int = 0
-
-
-@dataclass
+@dataclass(slots=True)
 class ObservationWorkItem:
     """Represents a unit of work for the background processor."""
     context_id: str
     observations: List[CatalogObservationDto]
 
 
+@dataclass(slots=True)
+class RawXmlWorkItem:
+    """Represents unparsed XML whose extraction is deferred to the background processor."""
+    context_id: str
+    xml_data: Union[bytes, str]
+    metadata: Dict[str, str]  # Private snapshot taken at submission
+
+
+WorkItem = Union[ObservationWorkItem, RawXmlWorkItem]
+
+
+class _PathFilter:
+    """
+    Compiled include/exclude rules for field paths.
+    Prefix rules match the path itself and everything beneath it ("/Root/Header" matches
+    "/Root/Header/Id" and "/Root/Header/@version" but not "/Root/HeaderText"). Pattern
+    rules are regular expressions searched anywhere in the path, compiled into one
+    alternation. Invalid patterns are reported to on_error and left out rather than
+    failing initialization. Decisions are memoized per path, since the same paths recur
+    in every document.
+    """
+
+    def __init__(self, include_paths: Optional[Iterable[str]],
+                 exclude_paths: Optional[Iterable[str]],
+                 exclude_patterns: Optional[Iterable[str]],
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        self._include = self._compile_prefixes(include_paths)
+        self._exclude = self._compile_prefixes(exclude_paths)
+        self._exclude_pattern = self._compile_patterns(exclude_patterns, on_error)
+        self._decisions: Dict[str, bool] = {}
+
+    @staticmethod
+    def _compile_patterns(patterns: Optional[Iterable[str]],
+                          on_error: Optional[Callable[[Exception], None]]) -> Optional[re.Pattern]:
+        """Returns one regex matching any valid pattern, or None if there are none."""
+        valid = []
+        for pattern in patterns or ():
+            try:
+                re.compile(pattern)
+            except re.error as ex:
+                _safe_invoke_error_callback(on_error, ex)
+                continue
+            valid.append(f"(?:{pattern})")
+        if not valid:
+            return None
+
+        try:
+            return re.compile("|".join(valid))
+        except re.error as ex:
+            # Valid on their own but not combined (e.g. inline global flags after the
+            # first pattern); run without pattern rules rather than without the SDK
+            _safe_invoke_error_callback(on_error, ex)
+            return None
+
+    @staticmethod
+    def _compile_prefixes(paths: Optional[Iterable[str]]) -> Optional[Tuple[frozenset, Tuple[str, ...]]]:
+        """Returns (exact paths, descendant prefixes) for str.startswith, or None if no rules."""
+        exact = frozenset(path.rstrip('/') for path in paths or () if path.strip('/'))
+        if not exact:
+            return None
+        return exact, tuple(path + '/' for path in exact)
+
+    @staticmethod
+    def _matches(rules: Tuple[frozenset, Tuple[str, ...]], field_path: str) -> bool:
+        exact, prefixes = rules
+        return field_path in exact or field_path.startswith(prefixes)
+
+    def allows(self, field_path: str) -> bool:
+        """Returns True if observations for this path should be reported."""
+        allowed = self._decisions.get(field_path)
+        if allowed is None:
+            allowed = (
+                (self._include is None or self._matches(self._include, field_path))
+                and (self._exclude is None or not self._matches(self._exclude, field_path))
+                and (self._exclude_pattern is None or not self._exclude_pattern.search(field_path))
+            )
+            if len(self._decisions) >= _PATH_CACHE_MAX_SIZE:
+                self._decisions.clear()
+            self._decisions[field_path] = allowed
+        return allowed
+
+
 class CatalogApiException(Exception):
     """Exception for catalog API errors (used internally for error reporting, never thrown to caller)."""
 
@@ -83,23 +211,111 @@ class CatalogApiException(Exception):
         self.__cause__ = cause
 
 
+class _WorkQueue:
+    """
+    Bounded FIFO between submitting threads and its single worker.
+    Producers append to a deque without taking a lock (deque.append is atomic) and then
+    set an Event unless it is already set. The worker clears the Event before re-checking
+    for items, so an append it missed is always followed by a set it will see. The
+    capacity check is not atomic with the append, so concurrent producers may briefly
+    overshoot it by a few items.
+
+    Above SHED_WATERMARK of capacity, items are rejected at random with a probability
+    that rises linearly to 1 at capacity. Under sustained overload this keeps a thinned
+    but continuous sample flowing instead of accepting everything until the queue is
+    full and then dropping every submission. The counters are unsynchronized and may
+    undercount slightly under concurrent submission.
+    """
+
+    def __init__(self, capacity: int):
+        self._items: collections.deque = collections.deque()
+        self._capacity = capacity
+        self._shed_threshold = int(capacity * SHED_WATERMARK)
+        self._not_empty = threading.Event()
+        self.enqueued = 0
+        self.dropped_full = 0
+        self.dropped_sampled = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def try_put(self, item: WorkItem, backlog: Optional[int] = None) -> bool:
+        """
+        Appends the item without blocking. Returns False if the item was dropped.
+        backlog is the number of items queued across every queue sharing this capacity;
+        it defaults to this queue's own length.
+        """
+        if self._capacity > 0:
+            size = len(self._items) if backlog is None else backlog
+            if size >= self._capacity:
+                self.dropped_full += 1
+                return False
+            if size > self._shed_threshold:
+                drop_probability = (size - self._shed_threshold) / (self._capacity - self._shed_threshold)
+                if random.random() < drop_probability:
+                    self.dropped_sampled += 1
+                    return False
+
+        self._items.append(item)
+        self.enqueued += 1
+
+        # Event.set() always takes the Event's internal lock; while the worker is busy
+        # the flag is usually still set, so the check keeps the common case lock-free
+        if not self._not_empty.is_set():
+            self._not_empty.set()
+        return True
+
+    def drain(self, max_items: int) -> List[WorkItem]:
+        """
+        Blocks until at least one item is available, then returns up to max_items
+        of the queued items in FIFO order.
+        """
+        items = self._items
+        while not items:
+            self._not_empty.clear()
+            if items:
+                break
+            self._not_empty.wait()
+
+        popleft = items.popleft
+        drained: List[WorkItem] = []
+        try:
+            while len(drained) < max_items:
+                drained.append(popleft())
+        except IndexError:
+            pass
+        return drained
+
+
 # Module-level state (mimics .NET static class)
-_queue: Optional[queue.Queue] = None
-_worker_thread: Optional[threading.Thread] = None
+_queues: List[_WorkQueue] = []  # One per worker; contexts are sharded across them
+_worker_threads: List[threading.Thread] = []
 _session: Optional[requests.Session] = None
 _base_url: str = ""
+_observations_url_template: str = OBSERVATIONS_ENDPOINT  # _base_url + endpoint, built once
 _batch_size: int = DEFAULT_BATCH_SIZE
 _global_error_handler: Optional[Callable[[Exception], None]] = None
+_path_filter: Optional[_PathFilter] = None
 _initialized: bool = False
 _state_lock = threading.Lock()  # Protects _initialized
 
+# (parent_path, separator, local_name) -> interned field path, shared across extractions
+_path_cache: Dict[Tuple[str, str, str], str] = {}
+_url_cache: Dict[str, str] = {}
+_NO_METADATA: Dict[str, str] = {}  # Shared, read-only snapshot for submissions without metadata
+_parser_local = threading.local()  # Per-thread reusable lxml pull parser
+
 
 def initialize(
     session: Optional[requests.Session],
     base_url: Optional[str],
     batch_size: int = DEFAULT_BATCH_SIZE,
     queue_capacity: int = DEFAULT_QUEUE_CAPACITY,
-    on_error: Optional[Callable[[Exception], None]] = None
+    on_error: Optional[Callable[[Exception], None]] = None,
+    worker_count: int = DEFAULT_WORKER_COUNT,
+    include_paths: Optional[Iterable[str]] = None,
+    exclude_paths: Optional[Iterable[str]] = None,
+    exclude_patterns: Optional[Iterable[str]] = None
 ) -> None:
     """
     Initializes the SDK. Must be called once at application startup before submitting observations.
@@ -108,38 +324,65 @@ def initialize(
         session: requests.Session instance for API communication (should be long-lived, shared instance)
         base_url: Base URL of the Ceremony Field Catalog API (e.g., "https://catalog.example.com")
         batch_size: Number of observations to send per API call (default: 500)
-        queue_capacity: Maximum queue size before dropping items (default: 10000)
-        on_error: Optional global error callback for logging (will not throw)
+        queue_capacity: Maximum number of queued items, across all workers, before dropping
+            items (default: 10000)
+        on_error: Optional global error callback for logging (will not throw); may be
+            invoked from any worker thread
+        worker_count: Number of background worker threads sending to the API (default: 2).
+            Each context is always handled by the same worker, so submissions for one
+            context are still sent one at a time and in order. At most this many POSTs are
+            in flight, so the session's connection pool (requests default: 10 per host)
+            should be at least this large
+        include_paths: Optional field paths to report; when given, only these paths and
+            their descendants are submitted (e.g., ["/Order/Customer"])
+        exclude_paths: Optional field paths whose observations (and descendants') are never submitted
+        exclude_patterns: Optional regular expressions; matching field paths are never submitted
     """
-    global _queue, _worker_thread, _session, _base_url, _batch_size
-    global _global_error_handler, _initialized
+    global _queues, _worker_threads, _session, _base_url, _observations_url_template, _batch_size
+    global _global_error_handler, _path_filter, _initialized
 
+    # Held for the whole setup so concurrent calls cannot both start workers
     with _state_lock:
         if _initialized:
             return  # Already initialized - ignore subsequent calls
 
-    try:
-        _session = session
-        _base_url = base_url.rstrip('/') if base_url else ""
-        _batch_size = batch_size if batch_size > 0 else DEFAULT_BATCH_SIZE
-        _global_error_handler = on_error
-
-        # Create bounded queue - put_nowait will raise queue.Full when full
-        _queue = queue.Queue(maxsize=queue_capacity)
-
-        # Start dedicated background worker thread
-        _worker_thread = threading.Thread(
-            target=_process_queue,
-            name="CeremonyFieldCatalog-Worker",
-            daemon=True  # Won't prevent application shutdown
-        )
-        _worker_thread.start()
+        try:
+            _session = session
+            _base_url = base_url.rstrip('/') if base_url else ""
+            _observations_url_template = _base_url + OBSERVATIONS_ENDPOINT
+            _batch_size = batch_size if batch_size > 0 else DEFAULT_BATCH_SIZE
+            _global_error_handler = on_error
+
+            if include_paths or exclude_paths or exclude_patterns:
+                _path_filter = _PathFilter(include_paths, exclude_paths, exclude_patterns, on_error)
+
+            # Create one queue per worker. Each is checked against the full capacity using
+            # the backlog summed over all of them, so one busy context can use all of it -
+            # try_put returns False when full
+            worker_count = worker_count if worker_count > 0 else DEFAULT_WORKER_COUNT
+            queues = [_WorkQueue(queue_capacity) for _ in range(worker_count)]
+
+            # Start dedicated background worker threads
+            threads = [
+                threading.Thread(
+                    target=_process_queue,
+                    args=(work_queue,),
+                    name=f"CeremonyFieldCatalog-Worker-{index}",
+                    daemon=True  # Won't prevent application shutdown
+                )
+                for index, work_queue in enumerate(queues)
+            ]
+            for thread in threads:
+                thread.start()
 
-        with _state_lock:
+            _worker_threads = threads
             _initialized = True
 
-    except Exception as ex:
-        _safe_invoke_error_callback(on_error, ex)
+            # Publishing the queues is what makes submissions start flowing
+            _queues = queues
+
+        except Exception as ex:
+            _safe_invoke_error_callback(on_error, ex)
 
 
 def reset() -> None:
@@ -147,17 +390,21 @@ def reset() -> None:
     Resets the SDK state. Used for testing purposes only.
     Should not be called in production code.
     """
-    global _queue, _worker_thread, _session, _base_url, _batch_size
-    global _global_error_handler, _initialized
+    global _queues, _worker_threads, _session, _base_url, _observations_url_template, _batch_size
+    global _global_error_handler, _path_filter, _initialized
 
     with _state_lock:
-        _queue = None
-        _worker_thread = None
+        _queues = []
+        _worker_threads = []
         _session = None
         _base_url = ""
+        _observations_url_template = OBSERVATIONS_ENDPOINT
         _batch_size = DEFAULT_BATCH_SIZE
         _global_error_handler = None
+        _path_filter = None
         _initialized = False
+        _path_cache.clear()
+        _url_cache.clear()
 
 
 # region Public Fire-and-Forget API
@@ -176,7 +423,7 @@ def submit_observations_bytes(
         context_id: Context identifier for the observations
         metadata: Metadata key-value pairs for the context
     """
-    _enqueue_work(lambda: _extract_observations_from_bytes(xml_data, metadata), context_id)
+    _enqueue_raw_xml(xml_data, context_id, metadata)
 
 
 def submit_observations_string(
@@ -193,7 +440,7 @@ def submit_observations_string(
         context_id: Context identifier for the observations
         metadata: Metadata key-value pairs for the context
     """
-    _enqueue_work(lambda: _extract_observations_from_string(xml_data, metadata), context_id)
+    _enqueue_raw_xml(xml_data, context_id, metadata)
 
 
 def submit_observations_element(
@@ -210,9 +457,34 @@ def submit_observations_element(
         context_id: Context identifier for the observations
         metadata: Metadata key-value pairs for the context
     """
+    # Checked here too so an uninitialized SDK doesn't even build the extraction closure
+    if not _queues:
+        return
     _enqueue_work(lambda: _extract_observations_from_element(xml_element, metadata), context_id)
 
 
+def get_stats() -> Dict[str, int]:
+    """
+    Returns submission counters since initialization, for operational visibility.
+    Never throws.
+
+    Returns:
+        queued: Work items currently waiting to be sent
+        enqueued: Work items accepted for sending
+        dropped_full: Work items dropped because the queue was full
+        dropped_sampled: Work items sampled out because the queue was near capacity
+    """
+    stats = {"queued": 0, "enqueued": 0, "dropped_full": 0, "dropped_sampled": 0}
+
+    for work_queue in _queues:
+        stats["queued"] += len(work_queue)
+        stats["enqueued"] += work_queue.enqueued
+        stats["dropped_full"] += work_queue.dropped_full
+        stats["dropped_sampled"] += work_queue.dropped_sampled
+
+    return stats
+
+
 # endregion
 
 
@@ -225,74 +497,132 @@ def _enqueue_work(
     """
     Enqueues work for background processing. Never blocks, never throws.
     """
-    # Silent fail if not initialized
-    if not _initialized or _queue is None:
+    # Silent fail if not initialized. The queue list is read once: it is only non-empty
+    # after initialize() finished, and reset() replaces rather than mutates it
+    queues = _queues
+    if not queues:
         return
 
     try:
         # Validate contextId
-        if not context_id or not context_id.strip():
+        if not context_id or context_id.isspace():
             return
 
-        # Extract observations (done on calling thread to avoid holding XML data)
+        # Extract observations on the calling thread; the caller owns the tree and may
+        # keep mutating it after submitting, so it cannot be handed to the worker
         observations = extraction_func()
         if not observations:
             return
 
         # Create work item
-        work_item = ObservationWorkItem(
-            context_id=context_id,
-            observations=observations
-        )
+        work_item = ObservationWorkItem(context_id, observations)
 
-        # Try to add to queue (non-blocking, drops if full)
-        try:
-            _queue.put_nowait(work_item)
-        except queue.Full:
-            # Queue is full - drop the item (matches .NET TryAdd behavior)
-            pass
+        _try_enqueue(queues, work_item)
 
     except Exception as ex:
         _safe_invoke_error_callback(_global_error_handler, ex)
 
 
-def _process_queue() -> None:
+def _enqueue_raw_xml(
+    xml_data: Optional[Union[bytes, str]],
+    context_id: Optional[str],
+    metadata: Optional[Dict[str, str]]
+) -> None:
     """
-    Background worker thread that processes the queue.
-    Blocks when empty, runs until process exits (daemon thread).
+    Enqueues unparsed XML for extraction on the worker thread. Never blocks, never throws.
+    The caller only pays for validation and a metadata snapshot, not for parsing.
     """
-    if _queue is None:
+    # Silent fail if not initialized (see _enqueue_work)
+    queues = _queues
+    if not queues:
         return
 
+    try:
+        # Validate contextId
+        if not context_id or context_id.isspace():
+            return
+
+        if not xml_data:
+            return
+
+        # The payload is queued by reference (bytes and str are immutable, so no copy is
+        # needed). Snapshot metadata so later changes by the caller don't leak into the
+        # submission; submissions without metadata share one empty dict that is never mutated.
+        # Positional arguments: keyword construction costs more than the rest of this call.
+        work_item = RawXmlWorkItem(context_id, xml_data, dict(metadata) if metadata else _NO_METADATA)
+
+        _try_enqueue(queues, work_item)
+
+    except Exception as ex:
+        _safe_invoke_error_callback(_global_error_handler, ex)
+
+
+def _try_enqueue(queues: List[_WorkQueue], work_item: WorkItem) -> None:
+    """
+    Adds a work item to its context's queue without blocking, dropping it if that queue is full.
+    Pinning a context to one worker keeps its submissions ordered and avoids concurrent
+    merges of the same context on the server.
+    """
+    if len(queues) == 1:
+        queues[0].try_put(work_item)
+        return
+
+    # The capacity is shared by all queues, so it is checked against their combined backlog.
+    # Queue is full or shedding load - drop the item (matches .NET TryAdd behavior)
+    work_queue = queues[hash(work_item.context_id) % len(queues)]
+    work_queue.try_put(work_item, sum(map(len, queues)))
+
+
+def _process_queue(work_queue: _WorkQueue) -> None:
+    """
+    Background worker thread that processes one queue.
+    Blocks when empty, runs until process exits (daemon thread).
+    """
     try:
         while True:
             try:
-                work_item = _queue.get()
+                work_items = _drain_queue(work_queue)
 
-                try:
-                    _process_work_item(work_item)
-                except Exception as ex:
-                    _safe_invoke_error_callback(_global_error_handler, ex)
-                finally:
-                    _queue.task_done()
+                for work_item in work_items:
+                    try:
+                        _process_work_item(work_item)
+                    except Exception as ex:
+                        _safe_invoke_error_callback(_global_error_handler, ex)
 
             except Exception as ex:
                 _safe_invoke_error_callback(_global_error_handler, ex)
 
     except Exception as ex:
-        # Queue.get can throw if something goes wrong
+        # Waiting on the queue can throw if something goes wrong
         _safe_invoke_error_callback(_global_error_handler, ex)
 
 
-def _process_work_item(work_item: ObservationWorkItem) -> None:
+def _drain_queue(work_queue: _WorkQueue) -> List[WorkItem]:
+    """
+    Blocks for the next work item, then takes whatever else is already queued
+    (up to MAX_DRAIN_SIZE) without waiting, so a burst costs one wakeup.
+    Items are not merged: the API treats each POST as one document's complete
+    field set, so every work item is still sent on its own.
+    """
+    return work_queue.drain(MAX_DRAIN_SIZE)
+
+
+def _process_work_item(work_item: WorkItem) -> None:
     """
     Processes a single work item by sending observations to the API.
+    Raw XML items are extracted here, on the worker thread.
     """
-    endpoint = OBSERVATIONS_ENDPOINT.format(work_item.context_id)
-    url = _base_url + endpoint
+    if isinstance(work_item, RawXmlWorkItem):
+        # The work item already owns a private metadata snapshot, so it is used as-is
+        observations = _extract_observations_from_xml(work_item.xml_data, work_item.metadata)
+        if not observations:
+            return
+    else:
+        observations = work_item.observations
+
+    url = _get_observations_url(work_item.context_id)
 
     # Send observations in batches
-    observations = work_item.observations
     for i in range(0, len(observations), _batch_size):
         try:
             batch = observations[i:i + _batch_size]
@@ -302,6 +632,59 @@ def _process_work_item(work_item: ObservationWorkItem) -> None:
             _safe_invoke_error_callback(_global_error_handler, batch_ex)
 
 
+def _get_observations_url(context_id: str) -> str:
+    """
+    Returns the full observations URL for a context, formatting it once per context.
+    """
+    url = _url_cache.get(context_id)
+    if url is None:
+        if len(_url_cache) >= _URL_CACHE_MAX_SIZE:
+            _url_cache.clear()
+        url = _observations_url_template.format(context_id)
+        _url_cache[context_id] = url
+    return url
+
+
+def _serialize_batch(batch: List[CatalogObservationDto]) -> bytes:
+    """
+    Serializes a batch to a UTF-8 JSON body, using orjson when available.
+    """
+    if _orjson is not None:
+        # Same keys as CatalogObservationDto.to_dict(), built inline to skip a method
+        # call per observation
+        return _orjson.dumps([
+            {
+                "metadata": obs.metadata,
+                "fieldPath": obs.field_path,
+                "count": obs.count,
+                "hasNull": obs.has_null,
+                "hasEmpty": obs.has_empty
+            }
+            for obs in batch
+        ])
+
+    # Without orjson, assemble the body from fragments. Observations from one extraction
+    # share a metadata dict, so it is encoded once per batch instead of once per field.
+    dumps = json.dumps
+    prefixes: Dict[int, str] = {}
+    fragments = []
+
+    for obs in batch:
+        prefix = prefixes.get(id(obs.metadata))
+        if prefix is None:
+            prefix = '{"metadata":' + dumps(obs.metadata, separators=(",", ":")) + ',"fieldPath":'
+            prefixes[id(obs.metadata)] = prefix
+
+        fragments.append(
+            f'{prefix}{dumps(obs.field_path)},"count":{int(obs.count)},'
+            f'"hasNull":{"true" if obs.has_null else "false"},'
+            f'"hasEmpty":{"true" if obs.has_empty else "false"}}}'
+        )
+
+    # Adding both brackets in one f-string copies the joined body once, not twice
+    return f"[{','.join(fragments)}]".encode("utf-8")
+
+
 def _send_batch(batch: List[CatalogObservationDto], url: str) -> None:
     """
     Sends a single batch to the API synchronously.
@@ -310,12 +693,9 @@ def _send_batch(batch: List[CatalogObservationDto], url: str) -> None:
         return
 
     try:
-        # Convert observations to JSON
-        json_data = [obs.to_dict() for obs in batch]
-
         response = _session.post(
             url,
-            json=json_data,
+            data=_serialize_batch(batch),
             headers={"Content-Type": "application/json"}
         )
 
@@ -359,11 +739,7 @@ def _extract_observations_from_bytes(
     if not xml_data:
         return []
 
-    try:
-        root = ET.fromstring(xml_data)
-        return _extract_observations_from_element(root, metadata)
-    except Exception:
-        return []
+    return _extract_observations_from_xml(xml_data, dict(metadata) if metadata else _NO_METADATA)
 
 
 def _extract_observations_from_string(
@@ -376,13 +752,137 @@ def _extract_observations_from_string(
     if not xml_data:
         return []
 
+    return _extract_observations_from_xml(xml_data, dict(metadata) if metadata else _NO_METADATA)
+
+
+def _extract_observations_from_xml(
+    xml_data: Union[bytes, str],
+    shared_metadata: Dict[str, str]
+) -> List[CatalogObservationDto]:
+    """
+    Extracts observations from bytes or string. Returns empty list on any error.
+    shared_metadata must be a dict owned by this extraction; it is referenced, not copied.
+    """
     try:
-        root = ET.fromstring(xml_data)
-        return _extract_observations_from_element(root, metadata)
+        if len(xml_data) <= _TREE_PARSE_MAX_SIZE:
+            field_stats: Dict[str, List[int]] = {}
+            _process_element_tree(ET.fromstring(xml_data), field_stats)
+            return _convert_statistics_to_observations(field_stats, shared_metadata)
+
+        return _extract_observations_from_events(_iterparse(xml_data), shared_metadata)
     except Exception:
         return []
 
 
+def _iterparse(xml_data: Union[bytes, str]) -> Iterator[Tuple[str, Any]]:
+    """
+    Returns a start/end event stream over the XML data.
+    Uses lxml's C tokenizer when installed, otherwise ElementTree's iterparse.
+    """
+    if _lxml_etree is not None:
+        return _iterparse_pooled(xml_data)
+
+    source = io.StringIO(xml_data) if isinstance(xml_data, str) else io.BytesIO(xml_data)
+    return ET.iterparse(source, events=("start", "end"))
+
+
+def _iterparse_pooled(xml_data: Union[bytes, str]) -> Iterator[Tuple[str, Any]]:
+    """
+    Streams events from a pull parser that is reused across documents on the same
+    thread. lxml parsers reset on close(), so a successful parse leaves the parser
+    ready for the next document; after a failure the parser is discarded instead.
+    Feeding the data directly also avoids wrapping it in a BytesIO, and str input
+    is decoded as-is (any encoding declaration is ignored, like ElementTree).
+    """
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _lxml_etree.XMLPullParser(**_LXML_ITERPARSE_OPTIONS)
+    else:
+        # Claim the parser so a re-entrant parse on this thread builds its own
+        _parser_local.parser = None
+
+    for offset in range(0, len(xml_data), _PARSE_CHUNK_SIZE):
+        parser.feed(xml_data[offset:offset + _PARSE_CHUNK_SIZE])
+        yield from parser.read_events()
+
+    parser.close()
+    yield from parser.read_events()
+
+    # Only reached when the document parsed cleanly and was fully consumed
+    _parser_local.parser = parser
+
+
+def _extract_observations_from_events(
+    events: Iterator[Tuple[str, Any]],
+    shared_metadata: Dict[str, str]
+) -> List[CatalogObservationDto]:
+    """
+    Extracts observations by streaming parse events instead of building the full tree.
+    Each element is cleared and detached from its parent once processed, so memory
+    stays proportional to document depth rather than document size.
+    Raises on malformed XML - callers are responsible for swallowing errors.
+    """
+    field_stats: Dict[str, List[int]] = {}
+    get_stats = field_stats.get
+    get_cached_path = _path_cache.get
+
+    # Parallel stacks for the currently open elements
+    path_stack: List[str] = []
+    element_stack: List[Any] = []
+
+    # An element is a leaf exactly when its end event directly follows its start event
+    is_leaf = False
+
+    for event, element in events:
+        if event == "start":
+            parent_path = path_stack[-1] if path_stack else ""
+            tag = element.tag
+            # Path cache hits are inlined; _build_path handles misses
+            current_path = get_cached_path((parent_path, _ELEMENT_SEPARATOR, tag))
+            if current_path is None:
+                current_path = _build_path(parent_path, _ELEMENT_SEPARATOR, tag)
+
+            path_stack.append(current_path)
+            element_stack.append(element)
+            is_leaf = True
+
+            # Attributes are complete on the start event.
+            # Statistics updates are inlined here; this is the per-node hot loop.
+            for attr_name, attr_value in element.items():
+                attribute_path = get_cached_path((current_path, _ATTRIBUTE_SEPARATOR, attr_name))
+                if attribute_path is None:
+                    attribute_path = _build_path(current_path, _ATTRIBUTE_SEPARATOR, attr_name)
+                stats = get_stats(attribute_path)
+                if stats is None:
+                    stats = field_stats[attribute_path] = [0, 0, 0]
+                stats[_TOTAL_OCCURRENCES] += 1
+                if not attr_value or attr_value.isspace():
+                    stats[_EMPTY_VALUE_COUNT] += 1
+        else:
+            current_path = path_stack.pop()
+            element_stack.pop()
+
+            if is_leaf:
+                is_leaf = False
+                stats = get_stats(current_path)
+                if stats is None:
+                    stats = field_stats[current_path] = [0, 0, 0]
+                stats[_TOTAL_OCCURRENCES] += 1
+
+                text = element.text
+                if not text or text.isspace():
+                    # Empty leaf element
+                    stats[_EMPTY_VALUE_COUNT] += 1
+
+            # Release the processed subtree. Earlier siblings were already detached,
+            # so this element is always the first child of its parent.
+            element.clear()
+            if element_stack:
+                del element_stack[-1][0]
+
+    return _convert_statistics_to_observations(field_stats, shared_metadata)
+
+
 def _extract_observations_from_element(
     xml_element: Optional[ET.Element],
     metadata: Optional[Dict[str, str]]
@@ -394,9 +894,9 @@ def _extract_observations_from_element(
         return []
 
     try:
-        field_stats: Dict[str, FieldStatistics] = {}
-        _process_element_recursive(xml_element, field_stats, metadata or {}, "")
-        return _convert_statistics_to_observations(field_stats)
+        field_stats: Dict[str, List[int]] = {}
+        _process_element_tree(xml_element, field_stats)
+        return _convert_statistics_to_observations(field_stats, dict(metadata) if metadata else _NO_METADATA)
     except Exception:
         return []
 
@@ -411,82 +911,100 @@ def _get_local_name(tag: str) -> str:
     return tag
 
 
-def _process_element_recursive(
-    element: ET.Element,
-    field_stats: Dict[str, FieldStatistics],
-    metadata: Dict[str, str],
-    parent_path: str
-) -> None:
+def _build_path(parent_path: str, separator: str, qualified_name: str) -> str:
     """
-    Recursively processes ElementTree Element (similar to XElement processing in .NET).
+    Returns parent_path + separator + local name, reusing a cached interned string.
+    The cache is keyed by the qualified tag or attribute name as the parser reports it,
+    so namespace stripping and concatenation only happen on a miss. Repeated siblings
+    resolve to the same path object, so field_stats lookups hit the identity fast path
+    instead of hashing a freshly built string.
     """
-    element_name = _get_local_name(element.tag)
-    current_path = parent_path + "/" + element_name
-
-    # Check if this is a leaf element (no child elements)
-    has_children = len(element) > 0
-
-    if element.text and element.text.strip() and not has_children:
-        # Has text content
-        _update_field_statistics(field_stats, current_path, metadata, element.text)
-    elif not has_children:
-        # Empty leaf element
-        _update_field_statistics(field_stats, current_path, metadata, "")
-
-    # Process attributes
-    for attr_name, attr_value in element.attrib.items():
-        local_attr_name = _get_local_name(attr_name)
-        attribute_path = current_path + "/@" + local_attr_name
-        _update_field_statistics(field_stats, attribute_path, metadata, attr_value)
-
-    # Recurse into child elements
-    for child in element:
-        _process_element_recursive(child, field_stats, metadata, current_path)
-
-
-def _update_field_statistics(
-    field_stats: Dict[str, FieldStatistics],
-    field_path: str,
-    metadata: Dict[str, str],
-    value: Optional[str]
+    key = (parent_path, separator, qualified_name)
+    path = _path_cache.get(key)
+    if path is None:
+        if len(_path_cache) >= _PATH_CACHE_MAX_SIZE:
+            _path_cache.clear()
+        path = sys.intern("".join((parent_path, separator, _get_local_name(qualified_name))))
+        _path_cache[key] = path
+    return path
+
+
+def _process_element_tree(
+    root: ET.Element,
+    field_stats: Dict[str, List[int]]
 ) -> None:
     """
-    Updates field statistics.
+    Walks an ElementTree Element (similar to XElement processing in .NET) in document order.
+    Uses an explicit stack rather than recursion, so deeply nested documents are neither
+    limited by the interpreter's recursion limit nor pay for a frame per element.
+    Path cache hits and statistics updates are inlined; this loop runs once per node.
     """
-    if field_path not in field_stats:
-        field_stats[field_path] = FieldStatistics(
-            field_path=field_path,
-            metadata=dict(metadata),
-            total_occurrences=0
-        )
-
-    stats = field_stats[field_path]
-    stats.total_occurrences += 1
-
-    if value is None:
-        stats.null_value_count += 1
-    elif not value or not value.strip():
-        stats.empty_value_count += 1
+    get_stats = field_stats.get
+    get_cached_path = _path_cache.get
+    stack: List[Tuple[ET.Element, str]] = [(root, "")]
+    pop = stack.pop
+    extend = stack.extend
+
+    while stack:
+        element, parent_path = pop()
+        tag = element.tag
+        current_path = (get_cached_path((parent_path, _ELEMENT_SEPARATOR, tag))
+                        or _build_path(parent_path, _ELEMENT_SEPARATOR, tag))
+
+        if len(element):
+            # Push children in reverse so they are visited first-to-last
+            extend([(child, current_path) for child in reversed(element)])
+        else:
+            # Leaf element; whitespace-only text counts as empty
+            stats = get_stats(current_path)
+            if stats is None:
+                stats = field_stats[current_path] = [0, 0, 0]
+            stats[_TOTAL_OCCURRENCES] += 1
+
+            text = element.text
+            if not text or text.isspace():
+                stats[_EMPTY_VALUE_COUNT] += 1
+
+        # Process attributes
+        attrib = element.attrib
+        if attrib:
+            for attr_name, attr_value in attrib.items():
+                attribute_path = (get_cached_path((current_path, _ATTRIBUTE_SEPARATOR, attr_name))
+                                  or _build_path(current_path, _ATTRIBUTE_SEPARATOR, attr_name))
+                stats = get_stats(attribute_path)
+                if stats is None:
+                    stats = field_stats[attribute_path] = [0, 0, 0]
+                stats[_TOTAL_OCCURRENCES] += 1
+                if not attr_value or attr_value.isspace():
+                    stats[_EMPTY_VALUE_COUNT] += 1
 
 
 def _convert_statistics_to_observations(
-    field_stats: Dict[str, FieldStatistics]
+    field_stats: Dict[str, List[int]],
+    shared_metadata: Dict[str, str]
 ) -> List[CatalogObservationDto]:
     """
-    Converts statistics to DTOs.
+    Converts statistics to DTOs, dropping paths rejected by the configured path filter.
+    Metadata is invariant for a single extraction, so the caller's private copy is
+    referenced by every DTO rather than copied per field.
     """
-    observations = []
-
-    for stats in field_stats.values():
-        observations.append(CatalogObservationDto(
-            metadata=stats.metadata,
-            field_path=stats.field_path,
-            count=stats.total_occurrences,
-            has_null=stats.null_value_count > 0,
-            has_empty=stats.empty_value_count > 0
-        ))
-
-    return observations
+    path_filter = _path_filter
+    items: Iterable[Tuple[str, List[int]]] = field_stats.items()
+    if path_filter is not None:
+        items = [(field_path, stats) for field_path, stats in items if path_filter.allows(field_path)]
+
+    # Positional construction in one comprehension; keyword arguments roughly double
+    # the cost of building each DTO
+    return [
+        CatalogObservationDto(
+            shared_metadata,
+            field_path,
+            stats[_TOTAL_OCCURRENCES],
+            stats[_NULL_VALUE_COUNT] > 0,
+            stats[_EMPTY_VALUE_COUNT] > 0
+        )
+        for field_path, stats in items
+    ]
 
 
 # endregion
@@ -516,9 +1034,9 @@ def _safe_invoke_error_callback(
 
 # region Testing Helpers (for internal use)
 
-def _get_queue() -> Optional[queue.Queue]:
-    """Returns the internal queue. For testing only."""
-    return _queue
+def _get_queues() -> List[_WorkQueue]:
+    """Returns the internal per-worker queues. For testing only."""
+    return _queues
 
 
 def _is_initialized() -> bool:
@@ -9,9 +9,12 @@ Run with: pytest test_ceremony_catalog_sdk.py -v
 
 import pytest
 import json
+import sys
 import queue
+import re
 import threading
 import time
+import tracemalloc
 import xml.etree.ElementTree as ET
 from unittest.mock import Mock, patch, MagicMock
 from typing import List, Dict, Any
@@ -55,6 +58,11 @@ def initialized_sdk(mock_session):
     return mock_session
 
 
+def _posted_payload(call_args) -> List[Dict[str, Any]]:
+    """Decode the JSON body passed to session.post."""
+    return json.loads(call_args.kwargs['data'])
+
+
 # =============================================================================
 # XML Extraction Tests
 # =============================================================================
@@ -144,6 +152,27 @@ class TestXmlExtraction:
         for obs in observations:
             assert obs.metadata == metadata
 
+    def test_metadata_shared_across_observations(self):
+        """Test that one metadata copy is shared by all observations of an extraction."""
+        xml = '<Root a="1"><Child>value</Child><Other/></Root>'
+        metadata = {"productCode": "DDA"}
+
+        observations = sdk._extract_observations_from_string(xml, metadata)
+        metadata["productCode"] = "changed"
+
+        assert len(observations) == 3
+        assert all(obs.metadata is observations[0].metadata for obs in observations)
+        assert observations[0].metadata == {"productCode": "DDA"}
+
+    def test_missing_metadata_shared_across_extractions(self):
+        """Test that extractions without metadata all reference the same empty dict."""
+        first = sdk._extract_observations_from_string("<Root><A>1</A></Root>", None)
+        second = sdk._extract_observations_from_bytes(b"<Root><B>2</B></Root>", {})
+        third = sdk._extract_observations_from_element(ET.fromstring("<Root><C>3</C></Root>"), None)
+
+        assert all(obs.metadata is sdk._NO_METADATA for obs in first + second + third)
+        assert sdk._NO_METADATA == {}
+
     def test_bytes_input(self):
         """Test extraction from bytes input."""
         xml_bytes = b"<Root><Child>value</Child></Root>"
@@ -218,6 +247,17 @@ class TestXmlExtraction:
         assert len(child_obs) == 1
         assert child_obs[0].has_empty is True  # Whitespace-only is considered empty
 
+    def test_whitespace_values_are_empty_in_all_extractors(self):
+        """Test that whitespace-only text and attributes are empty for every input type."""
+        xml = '<Root code=" \t"><Child>\u00a0\n </Child><Value> x </Value></Root>'
+
+        for observations in (
+            sdk._extract_observations_from_string(xml, {}),
+            sdk._extract_observations_from_element(ET.fromstring(xml), {}),
+        ):
+            empties = {obs.field_path: obs.has_empty for obs in observations}
+            assert empties == {"/Root/@code": True, "/Root/Child": True, "/Root/Value": False}
+
     def test_cdata_content(self):
         """Test handling of CDATA content."""
         xml = "<Root><Data><![CDATA[Some <content> here]]></Data></Root>"
@@ -231,6 +271,157 @@ class TestXmlExtraction:
         assert data_obs[0].has_empty is False
 
 
+    def test_streaming_matches_element_extraction(self, monkeypatch):
+        """Test that tree and streaming string/bytes extraction match the Element walker."""
+        xml = """
+        <Root version="1">
+            <Account type="checking">
+                <Number>123</Number>
+                <Owner><Name>A</Name><Email/></Owner>
+            </Account>
+            <Account type="savings">
+                <Number>456</Number>
+                <Owner><Name>B</Name><Email>  </Email></Owner>
+            </Account>
+        </Root>
+        """
+        metadata = {"source": "parity"}
+
+        def as_set(observations):
+            return {(o.field_path, o.count, o.has_null, o.has_empty) for o in observations}
+
+        expected = as_set(sdk._extract_observations_from_element(ET.fromstring(xml), metadata))
+
+        assert as_set(sdk._extract_observations_from_string(xml, metadata)) == expected
+        assert as_set(sdk._extract_observations_from_bytes(xml.encode("utf-8"), metadata)) == expected
+
+        # Force the streaming path used for large documents
+        monkeypatch.setattr(sdk, "_TREE_PARSE_MAX_SIZE", 0)
+        assert as_set(sdk._extract_observations_from_string(xml, metadata)) == expected
+        assert as_set(sdk._extract_observations_from_bytes(xml.encode("utf-8"), metadata)) == expected
+
+    @pytest.mark.parametrize("tree_parse_max_size", [sdk._TREE_PARSE_MAX_SIZE, 0])
+    def test_bytes_with_encoding_declaration(self, monkeypatch, tree_parse_max_size):
+        """Test that bytes input honors the XML encoding declaration."""
+        monkeypatch.setattr(sdk, "_TREE_PARSE_MAX_SIZE", tree_parse_max_size)
+        xml_bytes = '<?xml version="1.0" encoding="ISO-8859-1"?><Root><Name>caf\u00e9</Name></Root>'.encode("iso-8859-1")
+
+        observations = sdk._extract_observations_from_bytes(xml_bytes, {})
+
+        paths = [obs.field_path for obs in observations]
+        assert "/Root/Name" in paths
+
+    @pytest.mark.parametrize("tree_parse_max_size", [sdk._TREE_PARSE_MAX_SIZE, 0])
+    def test_string_with_encoding_declaration(self, monkeypatch, tree_parse_max_size):
+        """Test that str input ignores a declared encoding in both parse paths."""
+        monkeypatch.setattr(sdk, "_TREE_PARSE_MAX_SIZE", tree_parse_max_size)
+        xml = '<?xml version="1.0" encoding="ISO-8859-1"?><Root a="\u20ac"><Name>caf\u00e9</Name></Root>'
+
+        observations = sdk._extract_observations_from_string(xml, {})
+
+        assert {obs.field_path for obs in observations} == {"/Root/@a", "/Root/Name"}
+
+
+    def test_stdlib_fallback_matches_lxml(self, monkeypatch):
+        """Test that the ElementTree fallback produces the same observations as lxml."""
+        pytest.importorskip("lxml")
+        monkeypatch.setattr(sdk, "_TREE_PARSE_MAX_SIZE", 0)
+        xml = '<Root a="1"><!-- note --><Item>x</Item><?pi data?><Item/><Group><Leaf>y</Leaf></Group></Root>'
+
+        def as_set(observations):
+            return {(o.field_path, o.count, o.has_null, o.has_empty) for o in observations}
+
+        with_lxml = as_set(sdk._extract_observations_from_string(xml, {}))
+        monkeypatch.setattr(sdk, "_lxml_etree", None)
+        with_stdlib = as_set(sdk._extract_observations_from_string(xml, {}))
+
+        assert with_lxml == with_stdlib
+        assert ("/Root/Item", 2, False, True) in with_lxml
+
+    def test_pull_parser_is_reused_after_success_only(self, monkeypatch):
+        """Test that the pooled parser survives clean parses and is dropped after errors."""
+        pytest.importorskip("lxml")
+        monkeypatch.setattr(sdk, "_TREE_PARSE_MAX_SIZE", 0)
+        sdk._extract_observations_from_bytes(b"<Root><A>1</A></Root>", {})
+        parser = sdk._parser_local.parser
+
+        observations = sdk._extract_observations_from_string("<Other><B>2</B></Other>", {})
+        assert sdk._parser_local.parser is parser
+        assert {o.field_path for o in observations} == {"/Other/B"}
+
+        assert sdk._extract_observations_from_bytes(b"<Root><Unclosed></Root>", {}) == []
+        assert sdk._parser_local.parser is None
+
+        observations = sdk._extract_observations_from_bytes(b"<Root><A>1</A></Root>", {})
+        assert {o.field_path for o in observations} == {"/Root/A"}
+
+    def test_document_larger_than_parse_chunk(self, monkeypatch):
+        """Test that documents fed to the parser in several slices extract fully."""
+        monkeypatch.setattr(sdk, "_TREE_PARSE_MAX_SIZE", 0)
+        item_count = sdk._PARSE_CHUNK_SIZE // 10
+        xml = "<Root>" + "<Item>value</Item>" * item_count + "</Root>"
+
+        observations = sdk._extract_observations_from_string(xml, {})
+
+        assert len(observations) == 1
+        assert observations[0].count == item_count
+
+    def test_large_document_streams_with_flat_memory(self, monkeypatch):
+        """Test that documents above the tree-parse limit are streamed, not built as a tree."""
+        # tracemalloc only sees Python allocations, so this measures the ElementTree path;
+        # lxml's tree lives in libxml2 (see the test below)
+        monkeypatch.setattr(sdk, "_lxml_etree", None)
+
+        items = "".join(
+            f'<Line n="{i}"><Sku>S{i}</Sku><Price currency="USD">{i}.00</Price></Line>'
+            for i in range(30000)
+        )
+        xml_bytes = f"<Order>{items}</Order>".encode("utf-8")
+        assert len(xml_bytes) > sdk._TREE_PARSE_MAX_SIZE
+
+        tracemalloc.start()
+        try:
+            observations = sdk._extract_observations_from_bytes(xml_bytes, {})
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        assert {obs.field_path: obs.count for obs in observations}["/Order/Line/Sku"] == 30000
+        # A built tree for this document peaks at well over ten times its size
+        assert peak < len(xml_bytes)
+
+    def test_streamed_elements_are_released_with_lxml(self, monkeypatch):
+        """Test that the lxml stream clears and detaches each element once processed."""
+        pytest.importorskip("lxml")
+        monkeypatch.setattr(sdk, "_TREE_PARSE_MAX_SIZE", 0)
+        real_iterparse = sdk._iterparse
+        unreleased = []
+
+        def watching_iterparse(xml_data):
+            previous_end = None
+            for event, element in real_iterparse(xml_data):
+                # The extractor has handled the previous end event by the time we resume;
+                # the parser runs ahead of the events, so the tree itself can't be sized
+                if previous_end is not None and (
+                    len(previous_end) or previous_end.attrib or previous_end.text
+                    or previous_end.getparent() is not None
+                ):
+                    unreleased.append(previous_end.tag)
+                previous_end = element if event == "end" else None
+                yield event, element
+
+        monkeypatch.setattr(sdk, "_iterparse", watching_iterparse)
+        items = "".join(
+            f'<Line n="{i}"><Sku>S{i}</Sku><Price currency="USD">{i}.00</Price></Line>'
+            for i in range(1000)
+        )
+
+        observations = sdk._extract_observations_from_string(f"<Order>{items}</Order>", {})
+
+        assert {obs.field_path: obs.count for obs in observations}["/Order/Line/Sku"] == 1000
+        assert unreleased == []
+
+
 class TestFieldPathBuilding:
     """Tests for field path building logic."""
 
@@ -250,6 +441,20 @@ class TestFieldPathBuilding:
         paths = [obs.field_path for obs in observations]
         assert "/A/B/C/D/E" in paths
 
+    def test_element_deeper_than_recursion_limit(self):
+        """Test that Element extraction does not depend on the recursion limit."""
+        depth = sys.getrecursionlimit() + 100
+        root = ET.Element("a")
+        leaf = root
+        for _ in range(depth - 1):
+            leaf = ET.SubElement(leaf, "a")
+        leaf.text = "value"
+
+        observations = sdk._extract_observations_from_element(root, {})
+
+        assert len(observations) == 1
+        assert observations[0].field_path == "/a" * depth
+
     def test_attribute_path_format(self):
         """Test that attribute paths use /@name format."""
         xml = '<Root myAttr="value"/>'
@@ -259,6 +464,89 @@ class TestFieldPathBuilding:
         assert "/Root/@myAttr" in paths
 
 
+    def test_repeated_paths_are_shared(self):
+        """Test that field paths from separate extractions are the same interned object."""
+        xml = '<Root><Item id="1">a</Item><Item id="2">b</Item></Root>'
+
+        first = {obs.field_path: obs for obs in sdk._extract_observations_from_string(xml, {})}
+        second = {obs.field_path: obs for obs in sdk._extract_observations_from_bytes(xml.encode(), {})}
+
+        assert first["/Root/Item"].field_path is second["/Root/Item"].field_path
+        assert first["/Root/Item/@id"].field_path is second["/Root/Item/@id"].field_path
+
+    def test_namespaced_names_share_local_path(self):
+        """Test that qualified names from different namespaces map to one interned path."""
+        first = sdk._build_path("/Root", "/@", "{urn:a}code")
+        second = sdk._build_path("/Root", "/@", "{urn:b}code")
+
+        assert first == "/Root/@code"
+        assert first is second
+        assert sdk._build_path("/Root", "/@", "{urn:a}code") is first
+
+    def test_path_cache_is_bounded(self):
+        """Test that the path cache is discarded once it reaches its size limit."""
+        items = "".join(f"<Field{i}/>" for i in range(sdk._PATH_CACHE_MAX_SIZE + 10))
+        observations = sdk._extract_observations_from_string(f"<Root>{items}</Root>", {})
+
+        assert len(observations) == sdk._PATH_CACHE_MAX_SIZE + 10
+        assert len(sdk._path_cache) <= sdk._PATH_CACHE_MAX_SIZE
+
+
+class TestPathFilter:
+    """Tests for include/exclude path filtering configured at initialize()."""
+
+    XML = (
+        '<Order id="1"><Header><Id>9</Id><CreatedAt>now</CreatedAt></Header>'
+        '<HeaderText>t</HeaderText><Customer><Name>n</Name><TraceId>x</TraceId></Customer></Order>'
+    )
+
+    def _paths(self, **filters):
+        sdk.initialize(session=Mock(), base_url="http://localhost:8080", **filters)
+        return {obs.field_path for obs in sdk._extract_observations_from_string(self.XML, {})}
+
+    def test_no_filter_reports_everything(self):
+        """Test that all paths are reported when no rules are configured."""
+        assert len(self._paths()) == 6
+
+    def test_include_paths_keep_descendants_only(self):
+        """Test that include prefixes match whole path segments."""
+        paths = self._paths(include_paths=["/Order/Header"])
+        assert paths == {"/Order/Header/Id", "/Order/Header/CreatedAt"}
+
+    def test_exclude_paths_and_patterns(self):
+        """Test that exclude prefixes and regex patterns both drop paths."""
+        paths = self._paths(exclude_paths=["/Order/Header/"], exclude_patterns=[r"/@id$", "TraceId"])
+        assert paths == {"/Order/HeaderText", "/Order/Customer/Name"}
+
+    def test_invalid_pattern_is_reported_and_skipped(self):
+        """Test that a malformed pattern is reported without disabling the SDK or other rules."""
+        errors = []
+        paths = self._paths(exclude_patterns=["TraceId", "(unclosed"], on_error=errors.append)
+
+        assert sdk._initialized
+        assert paths == {
+            "/Order/@id", "/Order/Header/Id", "/Order/Header/CreatedAt",
+            "/Order/HeaderText", "/Order/Customer/Name",
+        }
+        assert len(errors) == 1
+        assert isinstance(errors[0], re.error)
+
+    def test_patterns_that_cannot_combine_are_dropped(self):
+        """Test that patterns valid alone but not as one alternation leave filtering off."""
+        errors = []
+        paths = self._paths(exclude_patterns=["TraceId", "(?i)name"], on_error=errors.append)
+
+        assert sdk._initialized
+        assert len(paths) == 6
+        assert len(errors) == 1
+
+    def test_filter_cleared_by_reset(self):
+        """Test that reset() removes a previously configured filter."""
+        self._paths(include_paths=["/Order/Header"])
+        sdk.reset()
+        assert len(self._paths()) == 6
+
+
 # =============================================================================
 # Queue Behavior Tests
 # =============================================================================
@@ -289,12 +577,10 @@ class TestQueueBehavior:
             queue_capacity=2  # Very small queue
         )
 
-        # Block the worker by not processing
-        original_process = sdk._process_work_item
-
+        # Block the worker by not processing. The item is never forwarded to the
+        # session so the stalled worker cannot post into a later test's mock.
         def slow_process(work_item):
             time.sleep(1)  # Slow processing
-            original_process(work_item)
 
         with patch.object(sdk, '_process_work_item', slow_process):
             xml = "<Root><Child>value</Child></Root>"
@@ -330,6 +616,281 @@ class TestQueueBehavior:
         assert mock_session.post.call_count == 5
 
 
+    def test_string_submission_defers_parsing_to_worker(self, mock_session):
+        """Test that raw XML is queued unparsed with a snapshot of the metadata."""
+        sdk.initialize(
+            session=mock_session,
+            base_url="http://localhost:8080",
+            batch_size=100,
+            queue_capacity=100
+        )
+
+        queued = []
+        with patch.object(sdk, '_try_enqueue', lambda queues, work_item: queued.append(work_item)):
+            metadata = {"productCode": "DDA"}
+            xml = "<Root><A>1</A></Root>"
+            sdk.submit_observations_string(xml, "ctx", metadata)
+            metadata["productCode"] = "changed"
+
+        assert len(queued) == 1
+        assert isinstance(queued[0], sdk.RawXmlWorkItem)
+        assert queued[0].xml_data is xml  # Queued as-is, never encoded on the caller thread
+        assert queued[0].metadata == {"productCode": "DDA"}
+
+    def test_element_submission_is_captured_at_submit_time(self, mock_session):
+        """Test that mutating a submitted Element afterwards does not change what is sent."""
+        sdk.initialize(
+            session=mock_session,
+            base_url="http://localhost:8080",
+            batch_size=100,
+            queue_capacity=100
+        )
+
+        release = threading.Event()
+        original_process = sdk._process_work_item
+
+        def gated_process(work_item):
+            release.wait(2)
+            original_process(work_item)
+
+        with patch.object(sdk, '_process_work_item', gated_process):
+            root = ET.fromstring("<Root><Before>1</Before></Root>")
+            sdk.submit_observations_element(root, "ctx", {})
+
+            # Callers commonly reuse or keep editing the tree after submitting
+            root.remove(root[0])
+            ET.SubElement(root, "After").text = "2"
+            release.set()
+            time.sleep(0.5)
+
+        paths = [obs["fieldPath"] for obs in _posted_payload(mock_session.post.call_args)]
+        assert paths == ["/Root/Before"]
+
+    def test_worker_reuses_submission_metadata_snapshot(self):
+        """Test that worker-side extraction does not copy the snapshot again."""
+        snapshot = {"productCode": "DDA"}
+        work_item = sdk.RawXmlWorkItem(context_id="ctx", xml_data="<Root><A>1</A><B/></Root>", metadata=snapshot)
+        sent = []
+
+        with patch.object(sdk, '_send_batch', lambda batch, url: sent.extend(batch)):
+            sdk._process_work_item(work_item)
+
+        assert len(sent) == 2
+        assert all(obs.metadata is snapshot for obs in sent)
+
+    def test_bytes_submission_queues_payload_without_copying(self, mock_session):
+        """Test that the submitted bytes object itself is queued."""
+        sdk.initialize(
+            session=mock_session,
+            base_url="http://localhost:8080",
+            batch_size=100,
+            queue_capacity=100
+        )
+
+        queued = []
+        payload = b"<Root><A>1</A></Root>"
+        with patch.object(sdk, '_try_enqueue', lambda queues, work_item: queued.append(work_item)):
+            sdk.submit_observations_bytes(payload, "ctx", None)
+
+        assert queued[0].xml_data is payload
+        assert queued[0].metadata == {}
+
+    def test_invalid_xml_is_not_posted(self, mock_session):
+        """Test that XML which fails to parse on the worker produces no request."""
+        sdk.initialize(
+            session=mock_session,
+            base_url="http://localhost:8080",
+            batch_size=100,
+            queue_capacity=100
+        )
+
+        sdk.submit_observations_bytes(b"<Root><Unclosed></Root>", "ctx", {})
+        sdk.submit_observations_string("<Root><A>1</A></Root>", "ctx", {})
+
+        time.sleep(0.5)
+
+        assert mock_session.post.call_count == 1
+
+    def test_drain_takes_queued_items_without_blocking(self):
+        """Test that the worker drains everything already queued in one pass."""
+        work_queue = sdk._WorkQueue(100)
+        for i in range(5):
+            work_queue.try_put(sdk.ObservationWorkItem(context_id=f"ctx-{i}", observations=[]))
+
+        drained = sdk._drain_queue(work_queue)
+
+        assert [item.context_id for item in drained] == [f"ctx-{i}" for i in range(5)]
+        assert len(work_queue) == 0
+
+    def test_work_queue_rejects_when_full(self):
+        """Test that try_put drops items once capacity is reached."""
+        work_queue = sdk._WorkQueue(2)
+        item = sdk.ObservationWorkItem(context_id="ctx", observations=[])
+
+        assert work_queue.try_put(item)
+        assert work_queue.try_put(item)
+        assert not work_queue.try_put(item)
+        assert len(work_queue) == 2
+
+    def test_work_queue_sheds_above_watermark(self):
+        """Test that items are sampled out between the watermark and capacity."""
+        work_queue = sdk._WorkQueue(100)
+        item = sdk.ObservationWorkItem(context_id="ctx", observations=[])
+
+        with patch.object(sdk.random, 'random', return_value=0.0):
+            accepted = sum(work_queue.try_put(item) for _ in range(200))
+
+        assert accepted == 81  # Below or at the watermark everything is accepted
+        assert work_queue.dropped_sampled == 119
+        assert work_queue.dropped_full == 0
+
+    def test_work_queue_accepts_above_watermark_when_not_sampled(self):
+        """Test that items above the watermark still get in until capacity is reached."""
+        work_queue = sdk._WorkQueue(100)
+        item = sdk.ObservationWorkItem(context_id="ctx", observations=[])
+
+        with patch.object(sdk.random, 'random', return_value=0.999):
+            accepted = sum(work_queue.try_put(item) for _ in range(150))
+
+        assert accepted == 100
+        assert work_queue.dropped_full == 50
+        assert work_queue.dropped_sampled == 0
+
+    def test_capacity_is_shared_across_worker_queues(self):
+        """Test that one context can fill the whole capacity, and then no queue accepts more."""
+        queues = [sdk._WorkQueue(100), sdk._WorkQueue(100)]
+        busy = "ctx-0"
+        other = next(
+            f"ctx-{i}" for i in range(1, 100)
+            if hash(f"ctx-{i}") % 2 != hash(busy) % 2
+        )
+
+        with patch.object(sdk.random, 'random', return_value=0.999):
+            for _ in range(200):
+                sdk._try_enqueue(queues, sdk.ObservationWorkItem(context_id=busy, observations=[]))
+            sdk._try_enqueue(queues, sdk.ObservationWorkItem(context_id=other, observations=[]))
+
+        assert sum(map(len, queues)) == 100
+        assert sorted(work_queue.dropped_full for work_queue in queues) == [1, 100]
+
+    def test_get_stats_reports_counters(self, mock_session):
+        """Test that get_stats sums counters across worker queues."""
+        assert sdk.get_stats() == {"queued": 0, "enqueued": 0, "dropped_full": 0, "dropped_sampled": 0}
+
+        sdk.initialize(session=mock_session, base_url="http://localhost", worker_count=2)
+        for i in range(4):
+            sdk.submit_observations_string("<Root><A>1</A></Root>", f"ctx-{i}", {})
+        time.sleep(0.5)
+
+        stats = sdk.get_stats()
+        assert stats["enqueued"] == 4
+        assert stats["queued"] == 0
+        assert stats["dropped_full"] == 0
+
+    def test_drain_wakes_when_item_arrives(self):
+        """Test that a blocked drain returns once a producer adds an item."""
+        work_queue = sdk._WorkQueue(10)
+        drained = []
+        consumer = threading.Thread(target=lambda: drained.extend(work_queue.drain(10)))
+        consumer.start()
+
+        time.sleep(0.1)
+        work_queue.try_put(sdk.ObservationWorkItem(context_id="ctx", observations=[]))
+        consumer.join(timeout=2)
+
+        assert not consumer.is_alive()
+        assert [item.context_id for item in drained] == ["ctx"]
+
+    def test_busy_worker_is_woken_once_per_burst(self):
+        """Test that producers only signal the worker when it may be waiting."""
+        work_queue = sdk._WorkQueue(0)
+        set_calls = []
+        original_set = work_queue._not_empty.set
+        work_queue._not_empty.set = lambda: (set_calls.append(1), original_set())
+
+        for _ in range(50):
+            work_queue.try_put(sdk.ObservationWorkItem(context_id="ctx", observations=[]))
+        assert len(work_queue.drain(100)) == 50
+
+        # The worker has not gone idle since draining, so these need no wakeup
+        for _ in range(50):
+            work_queue.try_put(sdk.ObservationWorkItem(context_id="ctx", observations=[]))
+        assert len(work_queue.drain(100)) == 50
+
+        assert len(set_calls) == 1
+
+    def test_drain_is_bounded(self):
+        """Test that a single drain never takes more than MAX_DRAIN_SIZE items."""
+        work_queue = sdk._WorkQueue(1000)
+        for i in range(sdk.MAX_DRAIN_SIZE + 5):
+            work_queue.try_put(sdk.ObservationWorkItem(context_id="ctx", observations=[]))
+
+        drained = sdk._drain_queue(work_queue)
+
+        assert len(drained) == sdk.MAX_DRAIN_SIZE
+        assert len(work_queue) == 5
+
+    def test_drained_items_are_posted_separately(self, mock_session):
+        """Test that each document keeps its own POST even when drained together."""
+        sdk.initialize(
+            session=mock_session,
+            base_url="http://localhost:8080",
+            batch_size=100,
+            queue_capacity=100
+        )
+
+        # Hold the worker so all submissions are queued before it drains
+        release = threading.Event()
+        original_process = sdk._process_work_item
+
+        def gated_process(work_item):
+            release.wait(2)
+            original_process(work_item)
+
+        with patch.object(sdk, '_process_work_item', gated_process):
+            for i in range(3):
+                sdk.submit_observations_string(f"<Root><Item>{i}</Item></Root>", "ctx", {})
+            release.set()
+            time.sleep(0.5)
+
+        assert mock_session.post.call_count == 3
+
+    def test_drained_documents_keep_their_own_counts(self, mock_session):
+        """Test that counts are never summed across documents for the same context.
+
+        The API reads count as occurrences within one document (maxOccurs) and treats
+        fields missing from a POST as optional (minOccurs=0), so each POST must describe
+        exactly one document.
+        """
+        sdk.initialize(
+            session=mock_session,
+            base_url="http://localhost:8080",
+            batch_size=100,
+            queue_capacity=100,
+            worker_count=1
+        )
+
+        release = threading.Event()
+        original_process = sdk._process_work_item
+
+        def gated_process(work_item):
+            release.wait(2)
+            original_process(work_item)
+
+        with patch.object(sdk, '_process_work_item', gated_process):
+            sdk.submit_observations_string("<Root><Item>a</Item><Item>b</Item></Root>", "ctx", {})
+            sdk.submit_observations_string("<Root><Item>a</Item><Item>b</Item></Root>", "ctx", {})
+            sdk.submit_observations_string("<Root><Other/></Root>", "ctx", {})
+            release.set()
+            time.sleep(0.5)
+
+        payloads = [
+            {obs["fieldPath"]: obs["count"] for obs in _posted_payload(call)}
+            for call in mock_session.post.call_args_list
+        ]
+        assert payloads == [{"/Root/Item": 2}, {"/Root/Item": 2}, {"/Root/Other": 1}]
+
+
 # =============================================================================
 # Batching Tests
 # =============================================================================
@@ -400,7 +961,7 @@ class TestBatching:
         call_args = mock_session.post.call_args
         assert call_args is not None
 
-        json_payload = call_args.kwargs.get('json') or call_args[1].get('json')
+        json_payload = _posted_payload(call_args)
         assert isinstance(json_payload, list)
         assert len(json_payload) > 0
 
@@ -448,6 +1009,17 @@ class TestFireAndForget:
         sdk.submit_observations_string(xml, None, {})
         sdk.submit_observations_string(xml, "   ", {})
 
+    def test_non_string_context_id_reported_not_raised(self, mock_session):
+        """Test that a context id of the wrong type goes to the error callback and is not sent."""
+        errors = []
+        sdk.initialize(session=mock_session, base_url="http://localhost", on_error=errors.append)
+
+        sdk.submit_observations_string("<Root/>", 123, {})
+        time.sleep(0.3)
+
+        assert len(errors) == 1
+        mock_session.post.assert_not_called()
+
     def test_never_throws_when_not_initialized(self):
         """Test that calling before initialize doesn't throw."""
         # SDK is reset, so not initialized
@@ -456,6 +1028,13 @@ class TestFireAndForget:
         # Should not raise
         sdk.submit_observations_string(xml, "test", {})
 
+    def test_element_not_extracted_when_not_initialized(self):
+        """Test that an uninitialized SDK returns before walking a submitted Element."""
+        with patch.object(sdk, '_extract_observations_from_element') as extract:
+            sdk.submit_observations_element(ET.fromstring("<Root><A>1</A></Root>"), "test", {})
+
+        extract.assert_not_called()
+
 
 # =============================================================================
 # Initialization Tests
@@ -534,6 +1113,100 @@ class TestInitialization:
 
         assert sdk._batch_size == sdk.DEFAULT_BATCH_SIZE
 
+    def test_concurrent_initialize_starts_workers_once(self, mock_session):
+        """Test that racing initialize() calls only create one set of workers."""
+        barrier = threading.Barrier(8)
+        created = []
+        real_work_queue = sdk._WorkQueue
+
+        def counting_work_queue(capacity):
+            created.append(capacity)
+            time.sleep(0.01)  # Widen the window between the check and the setup
+            return real_work_queue(capacity)
+
+        def init():
+            barrier.wait()
+            sdk.initialize(session=mock_session, base_url="http://localhost", worker_count=2)
+
+        with patch.object(sdk, '_WorkQueue', counting_work_queue):
+            threads = [threading.Thread(target=init) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert len(created) == 2
+        assert len(sdk._get_queues()) == 2
+
+    def test_different_contexts_post_concurrently(self, mock_session):
+        """Test that slow POSTs for one context do not hold up contexts on other workers."""
+        sdk.initialize(
+            session=mock_session,
+            base_url="http://localhost",
+            worker_count=2
+        )
+
+        # Pick two contexts that shard onto different workers
+        contexts = ["ctx-0"]
+        contexts.append(next(
+            f"ctx-{i}" for i in range(1, 100)
+            if hash(f"ctx-{i}") % 2 != hash(contexts[0]) % 2
+        ))
+
+        response = mock_session.post.return_value
+        intervals = []
+
+        def slow_post(*args, **kwargs):
+            started = time.monotonic()
+            time.sleep(0.3)
+            intervals.append((started, time.monotonic()))
+            return response
+
+        mock_session.post.side_effect = slow_post
+
+        for context_id in contexts:
+            sdk.submit_observations_string("<Root><A>1</A></Root>", context_id, {})
+        time.sleep(0.8)
+
+        assert len(intervals) == 2
+        (first_start, first_end), (second_start, second_end) = sorted(intervals)
+        assert second_start < first_end  # The requests overlapped
+
+    def test_initialize_starts_one_queue_per_worker(self, mock_session):
+        """Test that each worker gets its own queue, all bounded by the total capacity."""
+        sdk.initialize(
+            session=mock_session,
+            base_url="http://localhost",
+            queue_capacity=10,
+            worker_count=3
+        )
+
+        queues = sdk._get_queues()
+        assert len(queues) == 3
+        assert all(work_queue._capacity == 10 for work_queue in queues)
+        assert all(thread.is_alive() for thread in sdk._worker_threads)
+
+    def test_context_is_pinned_to_one_worker(self, mock_session):
+        """Test that all submissions for a context land on the same queue."""
+        sdk.initialize(
+            session=mock_session,
+            base_url="http://localhost",
+            worker_count=4
+        )
+
+        worker_names = []
+
+        def record_worker(work_item):
+            worker_names.append(threading.current_thread().name)
+
+        with patch.object(sdk, '_process_work_item', record_worker):
+            for _ in range(20):
+                sdk.submit_observations_string("<Root><A>1</A></Root>", "pinned", {})
+            time.sleep(0.5)
+
+        assert len(worker_names) == 20
+        assert len(set(worker_names)) == 1
+
 
 # =============================================================================
 # Error Handling Tests
@@ -687,7 +1360,7 @@ class TestApiContract:
 
         # Get the JSON that was sent
         call_args = mock_session.post.call_args
-        json_payload = call_args.kwargs.get('json') or call_args[1].get('json')
+        json_payload = _posted_payload(call_args)
 
         # Verify exact field names (camelCase matching Java DTO)
         for obs in json_payload:
@@ -721,6 +1394,24 @@ class TestApiContract:
         url = call_args[0][0]  # First positional arg
         assert url == "http://localhost:8080/catalog/contexts/my-context-id/observations"
 
+    def test_endpoint_url_cache_cleared_by_reset(self, mock_session):
+        """Test that cached URLs do not outlive the base URL they were built from."""
+        sdk.initialize(session=mock_session, base_url="http://first.com")
+        assert sdk._get_observations_url("ctx") == "http://first.com/catalog/contexts/ctx/observations"
+
+        sdk.reset()
+        sdk.initialize(session=mock_session, base_url="http://second.com")
+        assert sdk._get_observations_url("ctx") == "http://second.com/catalog/contexts/ctx/observations"
+
+    def test_endpoint_url_cache_is_bounded(self, mock_session):
+        """Test that an unbounded stream of context ids cannot grow the URL cache without limit."""
+        sdk.initialize(session=mock_session, base_url="http://localhost:8080")
+
+        for i in range(sdk._URL_CACHE_MAX_SIZE * 3):
+            assert sdk._get_observations_url(f"ctx-{i}") == f"http://localhost:8080/catalog/contexts/ctx-{i}/observations"
+
+        assert len(sdk._url_cache) <= sdk._URL_CACHE_MAX_SIZE
+
     def test_content_type_header(self, mock_session):
         """Test that Content-Type header is set correctly."""
         sdk.initialize(
@@ -759,6 +1450,51 @@ class TestApiContract:
             "hasEmpty": False
         }
 
+    def test_dtos_use_slots(self):
+        """Test that the per-observation DTOs carry no instance __dict__."""
+        dto = sdk.CatalogObservationDto(
+            metadata={}, field_path="/Root", count=1, has_null=False, has_empty=False
+        )
+        work_item = sdk.ObservationWorkItem(context_id="ctx", observations=[dto])
+
+        assert not hasattr(dto, "__dict__")
+        assert not hasattr(work_item, "__dict__")
+
+    def test_stdlib_json_fallback_matches_orjson(self, monkeypatch):
+        """Test that the stdlib encoder produces the same body as orjson."""
+        pytest.importorskip("orjson")
+        shared = {"key": "välue", "quote": 'a"b'}
+        batch = [
+            sdk.CatalogObservationDto(
+                metadata=shared,
+                field_path="/Root/Child",
+                count=2,
+                has_null=False,
+                has_empty=True
+            ),
+            sdk.CatalogObservationDto(
+                metadata=shared,
+                field_path='/Root/@a"b',
+                count=1,
+                has_null=True,
+                has_empty=False
+            ),
+            sdk.CatalogObservationDto(
+                metadata={},
+                field_path="/Other",
+                count=3,
+                has_null=False,
+                has_empty=False
+            ),
+        ]
+
+        fast_body = sdk._serialize_batch(batch)
+        monkeypatch.setattr(sdk, "_orjson", None)
+        fallback_body = sdk._serialize_batch(batch)
+
+        assert json.loads(fast_body) == json.loads(fallback_body)
+        assert json.loads(fallback_body) == [obs.to_dict() for obs in batch]
+
 
 # =============================================================================
 # Integration-Style Tests
@@ -818,7 +1554,7 @@ class TestIntegration:
         # Verify API was called
         assert mock_session.post.called
         call_args = mock_session.post.call_args
-        json_payload = call_args.kwargs.get('json') or call_args[1].get('json')
+        json_payload = _posted_payload(call_args)
 
         # Verify expected fields were extracted
         paths = [obs["fieldPath"] for obs in json_payload]
@@ -912,7 +1648,7 @@ class TestEdgeCases:
         time.sleep(1.0)
 
         call_args = initialized_sdk.post.call_args
-        json_payload = call_args.kwargs.get('json') or call_args[1].get('json')
+        json_payload = _posted_payload(call_args)
 
         paths = [obs["fieldPath"] for obs in json_payload]
         assert "/L1/L2/L3/L4/L5/L6/L7/L8/L9/L10" in paths
@@ -945,7 +1681,7 @@ class TestEdgeCases:
         time.sleep(1.0)
 
         call_args = initialized_sdk.post.call_args
-        json_payload = call_args.kwargs.get('json') or call_args[1].get('json')
+        json_payload = _posted_payload(call_args)
 
         # Metadata should be preserved as-is
         assert json_payload[0]["metadata"] == metadata
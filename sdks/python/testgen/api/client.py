@@ -10,7 +10,10 @@ Unlike the fire-and-forget SDK, this client provides proper error
 handling and feedback for the test generation workflow.
 """
 
+import json
+import sys
 import time
+import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from typing import Any
 
@@ -18,6 +21,39 @@ import requests
 
 from ..meta.config import ContextConfig
 
+# Attributes in this namespace (xsi:nil, xsi:type, ...) describe the document, not its fields
+_XSI_NAMESPACE = "http://www.w3.org/2001/XMLSchema-instance"
+_XSI_NIL = f"{{{_XSI_NAMESPACE}}}nil"
+
+# Error messages quote at most this many bytes of the response body; error pages
+# with full stack traces can be far larger than anything useful in a message
+_ERROR_BODY_LIMIT = 512
+
+try:
+    # Optional C-level JSON codec; falls back to the stdlib json module
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value to a compact UTF-8 JSON body."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(content: bytes) -> Any:
+    """Deserialize a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _error_body(response: requests.Response) -> str:
+    """Decode the start of a response body for an error message."""
+    return response.content[:_ERROR_BODY_LIMIT].decode("utf-8", "replace")
+
 
 @dataclass
 class SubmissionResult:
@@ -56,6 +92,9 @@ class TestGenApiClient:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.session = requests.Session()
+        # Contexts confirmed to exist by ensure_context_exists; contexts are not deleted
+        # during a run, so later lanes for the same context skip the round trip
+        self._known_contexts: set[str] = set()
 
     def close(self) -> None:
         """Close the session."""
@@ -94,7 +133,8 @@ class TestGenApiClient:
             True if context exists
         """
         try:
-            response = self.session.get(
+            # HEAD is answered by the GET mapping without transferring the context body
+            response = self.session.head(
                 f"{self.base_url}/catalog/contexts/{context_id}",
                 timeout=self.timeout,
             )
@@ -118,9 +158,9 @@ class TestGenApiClient:
                 timeout=self.timeout,
             )
             if response.status_code == 200:
-                return response.json()
+                return _loads(response.content)
             return None
-        except requests.RequestException:
+        except (requests.RequestException, ValueError):
             return None
 
     def create_context(self, config: ContextConfig) -> bool:
@@ -159,7 +199,7 @@ class TestGenApiClient:
                 return True
             else:
                 raise RuntimeError(
-                    f"Failed to create context: {response.status_code} - {response.text}"
+                    f"Failed to create context: {response.status_code} - {_error_body(response)}"
                 )
 
         except requests.RequestException as e:
@@ -178,10 +218,13 @@ class TestGenApiClient:
         Raises:
             RuntimeError: If context cannot be created
         """
-        if self.context_exists(config.context_id):
+        if config.context_id in self._known_contexts:
             return True
 
-        return self.create_context(config)
+        exists = self.context_exists(config.context_id) or self.create_context(config)
+        if exists:
+            self._known_contexts.add(config.context_id)
+        return exists
 
     def submit_observations(
         self,
@@ -207,12 +250,14 @@ class TestGenApiClient:
             return SubmissionResult(success=True, observation_count=0)
 
         url = f"{self.base_url}/catalog/contexts/{context_id}/observations"
+        # Serialized once, outside the loop, so retries resend the same body
+        body = _dumps(observations)
 
         for attempt in range(self.max_retries):
             try:
                 response = self.session.post(
                     url,
-                    json=observations,
+                    data=body,
                     timeout=self.timeout,
                     headers={"Content-Type": "application/json"},
                 )
@@ -230,14 +275,14 @@ class TestGenApiClient:
                     return SubmissionResult(
                         success=False,
                         observation_count=0,
-                        error_message=f"Server error: {response.status_code} - {response.text}",
+                        error_message=f"Server error: {response.status_code} - {_error_body(response)}",
                     )
                 else:
                     # Client error - don't retry
                     return SubmissionResult(
                         success=False,
                         observation_count=0,
-                        error_message=f"Client error: {response.status_code} - {response.text}",
+                        error_message=f"Client error: {response.status_code} - {_error_body(response)}",
                     )
 
             except requests.Timeout:
@@ -312,78 +357,72 @@ def extract_observations_from_xml(
     Returns:
         List of observation dicts
     """
-    import xml.etree.ElementTree as ET
-    from collections import defaultdict
-
     try:
         root = ET.fromstring(xml_content)
     except ET.ParseError:
         return []
 
-    # Track field statistics
-    field_stats: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {"count": 0, "has_null": False, "has_empty": False}
-    )
+    # Track field statistics as [count, has_null, has_empty]
+    field_stats: dict[str, list[Any]] = {}
+    local_names: dict[str, str] = {}
 
     def get_local_name(tag: str) -> str:
-        """Strip namespace from tag."""
-        if tag.startswith("{"):
-            return tag.split("}", 1)[1]
-        return tag
+        """Strip namespace from tag, once per distinct tag."""
+        name = local_names.get(tag)
+        if name is None:
+            name = sys.intern(tag.rpartition("}")[2])
+            local_names[tag] = name
+        return name
 
-    def process_element(element: ET.Element, parent_path: str) -> None:
-        """Recursively process elements."""
-        element_name = get_local_name(element.tag)
-        current_path = f"{parent_path}/{element_name}"
+    # Iterative depth-first walk in document order; children are pushed in reverse
+    stack: list[tuple[ET.Element, str]] = [(root, "")]
 
-        has_children = len(element) > 0
+    while stack:
+        element, parent_path = stack.pop()
+        current_path = f"{parent_path}/{get_local_name(element.tag)}"
 
         # Process leaf elements
-        if not has_children:
-            stats = field_stats[current_path]
-            stats["count"] += 1
+        if len(element) == 0:
+            stats = field_stats.get(current_path)
+            if stats is None:
+                stats = field_stats[current_path] = [0, False, False]
+            stats[0] += 1
 
             text = element.text
             if text is None:
                 # Check for xsi:nil
-                nil_attr = element.get("{http://www.w3.org/2001/XMLSchema-instance}nil")
-                if nil_attr == "true":
-                    stats["has_null"] = True
+                if element.get(_XSI_NIL) == "true":
+                    stats[1] = True
                 else:
-                    stats["has_empty"] = True
-            elif not text.strip():
-                stats["has_empty"] = True
+                    stats[2] = True
+            elif not text or text.isspace():
+                stats[2] = True
 
         # Process attributes
-        for attr_name, attr_value in element.attrib.items():
-            local_attr_name = get_local_name(attr_name)
+        for attr_name, attr_value in element.items():
             # Skip XSI attributes
-            if "XMLSchema-instance" in attr_name:
+            if _XSI_NAMESPACE in attr_name:
                 continue
-            attr_path = f"{current_path}/@{local_attr_name}"
-            stats = field_stats[attr_path]
-            stats["count"] += 1
-            if not attr_value or not attr_value.strip():
-                stats["has_empty"] = True
-
-        # Recurse into children
-        for child in element:
-            process_element(child, current_path)
-
-    # Process the document
-    process_element(root, "")
+            attr_path = f"{current_path}/@{get_local_name(attr_name)}"
+            stats = field_stats.get(attr_path)
+            if stats is None:
+                stats = field_stats[attr_path] = [0, False, False]
+            stats[0] += 1
+            if not attr_value or attr_value.isspace():
+                stats[2] = True
+
+        # Visit children next, first child on top
+        for child in reversed(element):
+            stack.append((child, current_path))
 
     # Convert to observation list
-    observations = []
-    for field_path, stats in field_stats.items():
-        observations.append(
-            {
-                "metadata": metadata,
-                "fieldPath": field_path,
-                "count": stats["count"],
-                "hasNull": stats["has_null"],
-                "hasEmpty": stats["has_empty"],
-            }
-        )
-
-    return observations
+    return [
+        {
+            "metadata": metadata,
+            "fieldPath": field_path,
+            "count": count,
+            "hasNull": has_null,
+            "hasEmpty": has_empty,
+        }
+        for field_path, (count, has_null, has_empty) in field_stats.items()
+    ]
@@ -109,6 +109,14 @@ def create_parser() -> argparse.ArgumentParser:
         default="http://localhost:8080",
         help="API base URL (default: http://localhost:8080)",
     )
+    run_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of lanes to run concurrently; lanes sharing a context still run "
+        "one at a time (default: 1)",
+    )
     run_parser.add_argument(
         "--seed",
         type=int,
@@ -202,6 +210,7 @@ def cmd_run(args: argparse.Namespace) -> int:
             fill_rate_override=args.fill_rate,
             seed=args.seed,
             verbose=args.verbose,
+            jobs=args.jobs,
         )
 
         if args.lanes:
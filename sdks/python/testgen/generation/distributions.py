@@ -37,10 +37,38 @@ class DistributionConfig:
     # Random seed for reproducibility
     seed: int | None = None
 
+    # Override values resolved from field_overrides at construction: path -> value.
+    # Only paths that set a value appear; defaults are read from the fields above at
+    # lookup time so they can still be adjusted after construction.
+    _fill_rates: dict[str, float] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _null_rates: dict[str, float] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _empty_rates: dict[str, float] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _repeat_ranges: dict[str, tuple[int, int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # Generator owned by this config, so seeding it neither touches nor depends on
+    # the global random module; seed is only read here, at construction
+    _rng: random.Random = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
-        """Initialize random generator with seed if provided."""
-        if self.seed is not None:
-            random.seed(self.seed)
+        """Create the random generator from the seed and resolve field overrides."""
+        self._rng = random.Random(self.seed)
+
+        for path, override in self.field_overrides.items():
+            for table, keys in (
+                (self._fill_rates, ("fillRate", "fill_rate")),
+                (self._null_rates, ("nullRate", "null_rate")),
+                (self._empty_rates, ("emptyRate", "empty_rate")),
+            ):
+                for key in keys:
+                    if key in override:
+                        table[path] = override[key]
+                        break
+
+            repeat = override.get("repeatRange", override.get("repeat_range"))
+            if repeat:
+                self._repeat_ranges[path] = (repeat[0], repeat[1])
 
     def should_include_optional(self, field_path: str) -> bool:
         """
@@ -52,8 +80,7 @@ class DistributionConfig:
         Returns:
             True if the field should be generated
         """
-        fill_rate = self._get_field_fill_rate(field_path)
-        return random.random() < fill_rate
+        return self._rng.random() < self._fill_rates.get(field_path, self.optional_field_fill_rate)
 
     def should_be_null(self, field_path: str) -> bool:
         """
@@ -65,8 +92,7 @@ class DistributionConfig:
         Returns:
             True if the field should be nil
         """
-        null_rate = self._get_field_null_rate(field_path)
-        return random.random() < null_rate
+        return self._rng.random() < self._null_rates.get(field_path, self.null_rate)
 
     def should_be_empty(self, field_path: str) -> bool:
         """
@@ -78,8 +104,7 @@ class DistributionConfig:
         Returns:
             True if the field should be an empty string
         """
-        empty_rate = self._get_field_empty_rate(field_path)
-        return random.random() < empty_rate
+        return self._rng.random() < self._empty_rates.get(field_path, self.empty_rate)
 
     def get_repeat_count(
         self, field_path: str, min_occurs: int = 1, max_occurs: int | None = None
@@ -96,7 +121,7 @@ class DistributionConfig:
             Number of times to generate the element
         """
         # Get configured repeat range
-        repeat_min, repeat_max = self._get_field_repeat_range(field_path)
+        repeat_min, repeat_max = self._repeat_ranges.get(field_path, self.repeat_range)
 
         # For unbounded elements, use the configured repeat range
         if max_occurs is None:
@@ -116,38 +141,34 @@ class DistributionConfig:
         if effective_max > 20:
             effective_max = 20
 
-        return random.randint(effective_min, effective_max)
+        return self._rng.randint(effective_min, effective_max)
 
     def _get_field_fill_rate(self, field_path: str) -> float:
         """Get fill rate for a specific field, with fallback to default."""
-        override = self.field_overrides.get(field_path, {})
-        return override.get("fillRate", override.get("fill_rate", self.optional_field_fill_rate))
+        return self._fill_rates.get(field_path, self.optional_field_fill_rate)
 
     def _get_field_null_rate(self, field_path: str) -> float:
         """Get null rate for a specific field, with fallback to default."""
-        override = self.field_overrides.get(field_path, {})
-        return override.get("nullRate", override.get("null_rate", self.null_rate))
+        return self._null_rates.get(field_path, self.null_rate)
 
     def _get_field_empty_rate(self, field_path: str) -> float:
         """Get empty rate for a specific field, with fallback to default."""
-        override = self.field_overrides.get(field_path, {})
-        return override.get("emptyRate", override.get("empty_rate", self.empty_rate))
+        return self._empty_rates.get(field_path, self.empty_rate)
 
     def _get_field_repeat_range(self, field_path: str) -> tuple[int, int]:
         """Get repeat range for a specific field, with fallback to default."""
-        override = self.field_overrides.get(field_path, {})
-        repeat = override.get("repeatRange", override.get("repeat_range"))
-        if repeat:
-            return (repeat[0], repeat[1])
-        return self.repeat_range
+        return self._repeat_ranges.get(field_path, self.repeat_range)
 
     @classmethod
-    def from_meta_config(cls, generation_config: Any) -> "DistributionConfig":
+    def from_meta_config(
+        cls, generation_config: Any, seed: int | None = None
+    ) -> "DistributionConfig":
         """
         Create DistributionConfig from a GenerationConfig object.
 
         Args:
             generation_config: GenerationConfig from meta file
+            seed: Optional random seed for reproducibility
 
         Returns:
             DistributionConfig instance
@@ -169,4 +190,5 @@ class DistributionConfig:
             empty_rate=defaults.empty_rate,
             repeat_range=defaults.repeat_range,
             field_overrides=field_overrides,
+            seed=seed,
         )
@@ -6,26 +6,67 @@ with configurable randomness for optional fields, null values, and
 repeating elements.
 """
 
+import io
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from xml.dom import minidom
+from typing import Callable
 from xml.etree import ElementTree as ET
 
 import xmlschema
 
 from ..meta.config import MetaConfig
-from ..xsd.model import XsdSchema, XsdElement, XsdAttribute
+from ..xsd.model import XsdSchema, XsdElement
+from ..xsd.parser import load_xml_schema, parse_xsd
 from .distributions import DistributionConfig
 from .values import ValueGeneratorRegistry, XsdTypeValueGenerator
 
 
 # XSI namespace for nil attribute
 XSI_NAMESPACE = "http://www.w3.org/2001/XMLSchema-instance"
-XSI_NIL = f"{{{XSI_NAMESPACE}}}nil"
+XSI_NIL = sys.intern(f"{{{XSI_NAMESPACE}}}nil")
+
+# Written by hand: ElementTree's own declaration is single-quoted and, for
+# str output, names the locale's encoding
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
 
 # Register the xsi namespace prefix so ElementTree uses it consistently
 ET.register_namespace('xsi', XSI_NAMESPACE)
 
 
+@dataclass(slots=True)
+class _ElementPlan:
+    """
+    Schema-invariant generation decisions for one element definition.
+
+    Compiled once per generator so that producing each document only makes
+    the random draws, without re-deriving paths, value generators or type
+    checks from the schema model.
+    """
+
+    name: str
+    path: str
+    min_occurs: int
+    max_occurs: int | None
+    optional: bool
+    nillable: bool
+
+    # Elements with maxOccurs=1 always occur exactly once (optional ones are
+    # then skipped by their fill rate), so no repeat count is drawn for them
+    repeats: bool
+
+    # Leaf text generator, set exactly when the element is a leaf, and the path
+    # to roll an empty value for (None when empty strings aren't valid, e.g.
+    # enumerations and non-strings)
+    text: Callable[[], str] | None = None
+    empty_path: str | None = None
+
+    # (name, path to roll inclusion for or None if required, fixed, default, generator)
+    attributes: tuple[tuple[str, str | None, str | None, str | None, Callable[[], str]], ...] = ()
+
+    children: tuple["_ElementPlan", ...] = ()
+
+
 class XmlGenerator:
     """
     Generates XML documents from an XSD schema model.
@@ -63,6 +104,10 @@ class XmlGenerator:
         if meta_config:
             self.semantic_types = meta_config.generation.semantic_types
 
+        # Generation plan for the primary root, compiled once from the schema
+        root_element = schema.get_primary_root()
+        self._root_plan = self._compile_plan(root_element) if root_element else None
+
     def generate(self) -> ET.Element:
         """
         Generate a complete XML document.
@@ -70,12 +115,11 @@ class XmlGenerator:
         Returns:
             ElementTree Element representing the root of the document
         """
-        root_element = self.schema.get_primary_root()
-        if not root_element:
+        if self._root_plan is None:
             raise ValueError("Schema has no root elements")
 
         # Create root element
-        root = self._generate_element(root_element)
+        root = self._generate_element(self._root_plan)
         if root is None:
             raise ValueError("Failed to generate root element")
 
@@ -94,64 +138,208 @@ class XmlGenerator:
         Returns:
             XML string
         """
-        root = self.generate()
-        xml_bytes = ET.tostring(root, encoding="unicode")
+        return self.to_string(self.generate(), pretty=pretty)
+
+    def to_string(self, root: ET.Element, pretty: bool = True) -> str:
+        """
+        Serialize a generated document to a string.
 
+        Args:
+            root: Root element returned by generate()
+            pretty: Whether to format with indentation (indents root in place)
+
+        Returns:
+            XML string
+        """
+        if pretty:
+            # Indent the freshly generated tree in place rather than reparsing the
+            # serialized document into a DOM just to pretty-print it
+            ET.indent(root, space="  ")
+
+        # Serialize straight after the declaration instead of concatenating it
+        # onto a separately built copy of the document
+        buffer = io.StringIO()
+        buffer.write(XML_DECLARATION)
+        ET.ElementTree(root).write(buffer, encoding="unicode")
         if pretty:
-            # Use minidom for pretty printing
-            dom = minidom.parseString(xml_bytes)
-            return dom.toprettyxml(indent="  ", encoding=None)
+            buffer.write("\n")
+        return buffer.getvalue()
+
+    def _compile_plan(self, element_def: XsdElement) -> _ElementPlan:
+        """Compile generation plans for an element definition and its descendants."""
+        plans: dict[int, _ElementPlan] = {}
+        compiled: list[XsdElement] = []
+        stack = [element_def]
+        while stack:
+            definition = stack.pop()
+            if id(definition) in plans:
+                continue
+            plans[id(definition)] = self._plan_element(definition)
+            compiled.append(definition)
+            stack.extend(definition.children)
+
+        for definition in compiled:
+            if definition.children:
+                plans[id(definition)].children = tuple(plans[id(child)] for child in definition.children)
+
+        return plans[id(element_def)]
+
+    def _plan_element(self, element_def: XsdElement) -> _ElementPlan:
+        """Resolve the per-element decisions that don't depend on random draws."""
+        path = element_def.full_path
+        # Tag and attribute names are interned so every generated node shares one
+        # string object (with its hash already computed) per name
+        plan = _ElementPlan(
+            name=sys.intern(element_def.name),
+            path=path,
+            min_occurs=element_def.min_occurs,
+            max_occurs=element_def.max_occurs,
+            optional=element_def.is_optional,
+            nillable=element_def.nillable,
+            repeats=element_def.max_occurs != 1,
+        )
+
+        plan.attributes = tuple(
+            (
+                sys.intern(attr_def.name),
+                None if attr_def.use == "required" else f"{path}/@{attr_def.name}",
+                attr_def.fixed,
+                attr_def.default,
+                self.xsd_value_generator.resolve(attr_def.type_def),
+            )
+            for attr_def in element_def.attributes
+        )
+
+        if element_def.is_leaf:
+            type_def = element_def.type_def
+
+            # Check for empty string (but NOT for enums - empty strings are invalid enum values)
+            if type_def:
+                is_enum = type_def.enumeration is not None
+                base_type = type_def.base_type.lower() if type_def.base_type else "string"
+                if base_type == "string" and not is_enum:
+                    plan.empty_path = path
+
+            # Semantic type mapping, falling back to XSD type-based generation
+            semantic_type = self.semantic_types.get(path)
+            if semantic_type:
+                plan.text = self.value_registry.resolve(semantic_type)
+            else:
+                plan.text = self.xsd_value_generator.resolve(type_def)
 
-        return f'<?xml version="1.0" encoding="UTF-8"?>\n{xml_bytes}'
+        return plan
 
-    def _generate_element(self, element_def: XsdElement) -> ET.Element | None:
+    def _generate_element(self, plan: _ElementPlan) -> ET.Element | None:
         """
         Generate a single XML element with all its content.
 
+        Descendants are generated with an explicit stack rather than by
+        recursion, visiting them in the same order (and so making the same
+        random draws) as a depth-first recursive walk.
+
         Args:
-            element_def: Element definition from schema
+            plan: Compiled plan for the element definition
 
         Returns:
             Generated Element, or None if skipped
         """
-        # Check if optional element should be skipped
-        if element_def.is_optional:
-            if not self.distribution.should_include_optional(element_def.full_path):
-                return None
+        root, expand = self._open_element(plan)
+        if root is None or not expand:
+            return root
+
+        # Frames are [element, plan, next child index, repeats left]
+        stack: list[list] = [[root, plan, 0, 0]]
+        while stack:
+            frame = stack[-1]
+            elem, elem_plan, index, remaining = frame
+
+            if remaining == 0:
+                if index < len(elem_plan.children):
+                    # Move on to the next child definition
+                    child_plan = elem_plan.children[index]
+                    frame[2] = index + 1
+                    if child_plan.repeats:
+                        frame[3] = self.distribution.get_repeat_count(
+                            child_plan.path,
+                            child_plan.min_occurs,
+                            child_plan.max_occurs,
+                        )
+                    else:
+                        frame[3] = 1
+                    continue
+
+                # All children generated - close this element
+                stack.pop()
+
+                # Skip empty container elements (no children generated)
+                # These would be observed as empty leaves by the SDK, which is misleading
+                if len(elem) == 0 and elem_plan.optional:
+                    if not stack:
+                        return None
+                elif stack:
+                    stack[-1][0].append(elem)
+                continue
+
+            frame[3] = remaining - 1
+            child_plan = elem_plan.children[index - 1]
+            child, expand = self._open_element(child_plan)
+            if child is None:
+                continue
+            if expand:
+                stack.append([child, child_plan, 0, 0])
+            else:
+                elem.append(child)
 
-        # Check if nillable element should be nil
-        if element_def.nillable:
-            if self.distribution.should_be_null(element_def.full_path):
-                return self._create_nil_element(element_def.name)
+        return root
 
-        # Create the element
-        elem = ET.Element(element_def.name)
+    def _open_element(self, plan: _ElementPlan) -> tuple[ET.Element | None, bool]:
+        """
+        Create an element with its attributes and, for leaves, its text.
+
+        Returns:
+            Tuple of (element or None if skipped, whether children still
+            need to be generated)
+        """
+        distribution = self.distribution
 
-        # Add attributes
-        for attr_def in element_def.attributes:
-            attr_value = self._generate_attribute_value(attr_def, element_def.full_path)
-            if attr_value is not None:
-                elem.set(attr_def.name, attr_value)
+        # Check if optional element should be skipped
+        if plan.optional and not distribution.should_include_optional(plan.path):
+            return None, False
 
-        # Handle content
-        if element_def.is_leaf:
-            # Leaf element - generate text content
-            elem.text = self._generate_text_value(element_def)
+        # Check if nillable element should be nil
+        if plan.nillable and distribution.should_be_null(plan.path):
+            return self._create_nil_element(plan.name), False
+
+        # Create the element, handing any attributes to the constructor in one dict
+        if plan.attributes:
+            attrib: dict[str, str] = {}
+            for name, optional_path, fixed, default, generate in plan.attributes:
+                # Check if optional attribute should be included
+                if optional_path is not None and not distribution.should_include_optional(optional_path):
+                    continue
+
+                if fixed:
+                    attrib[name] = fixed
+                elif default and distribution.should_include_optional("_use_default"):
+                    # Default value (might still generate different value)
+                    attrib[name] = default
+                else:
+                    attrib[name] = generate()
+            elem = ET.Element(plan.name, attrib)
         else:
-            # Complex element - generate children
-            for child_def in element_def.children:
-                count = self._get_child_count(child_def)
-                for _ in range(count):
-                    child = self._generate_element(child_def)
-                    if child is not None:
-                        elem.append(child)
-
-            # Skip empty container elements (no children generated)
-            # These would be observed as empty leaves by the SDK, which is misleading
-            if len(elem) == 0 and element_def.is_optional:
-                return None
+            elem = ET.Element(plan.name)
 
-        return elem
+        # Leaf element - generate text content
+        text = plan.text
+        if text is not None:
+            if plan.empty_path is not None and distribution.should_be_empty(plan.empty_path):
+                elem.text = ""
+            else:
+                elem.text = text()
+            return elem, False
+
+        # Complex element - children are generated by the caller
+        return elem, True
 
     def _create_nil_element(self, name: str) -> ET.Element:
         """Create an element with xsi:nil='true'."""
@@ -159,62 +347,9 @@ class XmlGenerator:
         elem.set(XSI_NIL, "true")
         return elem
 
-    def _generate_attribute_value(
-        self, attr_def: XsdAttribute, parent_path: str
-    ) -> str | None:
-        """Generate a value for an attribute."""
-        # Check if optional attribute should be included
-        if attr_def.use != "required":
-            attr_path = f"{parent_path}/@{attr_def.name}"
-            if not self.distribution.should_include_optional(attr_path):
-                return None
-
-        # Fixed value
-        if attr_def.fixed:
-            return attr_def.fixed
-
-        # Default value (might still generate different value)
-        if attr_def.default and self.distribution.should_include_optional("_use_default"):
-            return attr_def.default
-
-        # Generate value based on type
-        return self.xsd_value_generator.generate(attr_def.type_def)
-
-    def _generate_text_value(self, element_def: XsdElement) -> str:
-        """Generate text content for a leaf element."""
-        path = element_def.full_path
-
-        # Check for empty string (but NOT for enums - empty strings are invalid enum values)
-        if element_def.type_def:
-            is_enum = element_def.type_def.enumeration is not None
-            base_type = element_def.type_def.base_type.lower() if element_def.type_def.base_type else "string"
-            if base_type == "string" and not is_enum and self.distribution.should_be_empty(path):
-                return ""
-
-        # Check semantic type mapping
-        semantic_type = self.semantic_types.get(path)
-        if semantic_type:
-            return self.value_registry.generate(semantic_type)
-
-        # Fall back to XSD type-based generation
-        return self.xsd_value_generator.generate(element_def.type_def)
-
-    def _get_child_count(self, child_def: XsdElement) -> int:
-        """Determine how many times to generate a child element."""
-        return self.distribution.get_repeat_count(
-            child_def.full_path,
-            child_def.min_occurs,
-            child_def.max_occurs,
-        )
-
     def _has_nil_elements(self, element: ET.Element) -> bool:
         """Check if the tree contains any xsi:nil elements."""
-        if element.get(XSI_NIL):
-            return True
-        for child in element:
-            if self._has_nil_elements(child):
-                return True
-        return False
+        return any(node.get(XSI_NIL) for node in element.iter())
 
 
 class XmlValidator:
@@ -230,7 +365,9 @@ class XmlValidator:
             xsd_path: Path to the XSD schema file
         """
         self.xsd_path = xsd_path
-        self.xml_schema = xmlschema.XMLSchema(str(xsd_path))
+        # Compiled schemas are shared with parse_xsd and other validators for the same,
+        # unchanged file
+        self.xml_schema = load_xml_schema(xsd_path)
 
     def validate(self, xml_string: str) -> tuple[bool, list[str]]:
         """
@@ -242,10 +379,28 @@ class XmlValidator:
         Returns:
             Tuple of (is_valid, list of error messages)
         """
+        return self._validate(xml_string)
+
+    def validate_element(self, root: ET.Element) -> tuple[bool, list[str]]:
+        """
+        Validate an in-memory document against the schema.
+
+        Avoids serializing and re-parsing a tree that was just generated.
+
+        Args:
+            root: Root element of the document
+
+        Returns:
+            Tuple of (is_valid, list of error messages)
+        """
+        return self._validate(root)
+
+    def _validate(self, source: str | ET.Element) -> tuple[bool, list[str]]:
+        """Validate an XML string or element, collecting error messages."""
         errors: list[str] = []
 
         try:
-            self.xml_schema.validate(xml_string)
+            self.xml_schema.validate(source)
             return True, []
         except xmlschema.XMLSchemaValidationError as e:
             errors.append(str(e))
@@ -289,17 +444,13 @@ def generate_xml_from_xsd(
     Raises:
         ValueError: If validation fails
     """
-    from ..xsd.parser import parse_xsd
-
     # Parse schema
     schema = parse_xsd(xsd_path)
 
     # Create distribution config from meta
     distribution = None
     if meta_config:
-        distribution = DistributionConfig.from_meta_config(meta_config.generation)
-        if seed is not None:
-            distribution.seed = seed
+        distribution = DistributionConfig.from_meta_config(meta_config.generation, seed=seed)
 
     # Generate XML
     generator = XmlGenerator(
@@ -308,14 +459,14 @@ def generate_xml_from_xsd(
         distribution=distribution,
         seed=seed,
     )
-    xml_string = generator.generate_string(pretty=True)
+    root = generator.generate()
 
-    # Validate if requested
+    # Validate the generated tree before serializing it
     if validate:
         validator = XmlValidator(xsd_path)
-        is_valid, errors = validator.validate(xml_string)
+        is_valid, errors = validator.validate_element(root)
         if not is_valid:
             error_msg = "\n".join(errors)
             raise ValueError(f"Generated XML failed validation:\n{error_msg}")
 
-    return xml_string
+    return generator.to_string(root, pretty=True)
@@ -4,17 +4,66 @@ Value generators for XML element content.
 Provides realistic data generation using Faker and XSD constraints.
 """
 
+import itertools
 import random
 import re
 import string
 from datetime import date, timedelta
 from decimal import Decimal
+from functools import partial
 from typing import Any, Callable
 
 from faker import Faker
 
 from ..xsd.model import XsdSimpleType
 
+try:
+    # Optional full regex expander for xs:pattern facets
+    import exrex
+except ImportError:
+    exrex = None
+
+
+# Placeholders understood by "pattern:" semantic types
+_PATTERN_PLACEHOLDER = re.compile(r"\{(YYYY|YY|MM|DD|#+|A+|seq:\d+)\}")
+
+# xs:pattern facets handled without exrex, e.g. [A-Z]{3} or [0-9]{5}
+_SIMPLE_REGEX_PATTERN = re.compile(r"\[(A-Z|0-9)\]\{(\d+)\}")
+
+
+def _alphabet_table(alphabet: str) -> tuple[bytes, bytes]:
+    """
+    Build a bytes.translate() table and delete set mapping random bytes to an alphabet.
+
+    Bytes at or above the largest multiple of len(alphabet) are deleted rather
+    than wrapped around, so every character stays equally likely.
+    """
+    size = len(alphabet)
+    limit = 256 - 256 % size
+    table = bytes(ord(alphabet[b % size]) if b < limit else 0 for b in range(256))
+    return table, bytes(range(limit, 256))
+
+
+def _random_chars(rng: random.Random, alphabet: tuple[bytes, bytes], k: int) -> str:
+    """Draw k characters uniformly from an alphabet table built by _alphabet_table."""
+    table, rejected = alphabet
+    chars = rng.randbytes(k + k // 2 + 4).translate(table, rejected)
+    while len(chars) < k:
+        chars += rng.randbytes(k).translate(table, rejected)
+    return chars[:k].decode("ascii")
+
+
+# Bound str.format methods for the usual fraction digit counts, so formatting a
+# decimal doesn't build a format spec from a nested f-string field every call
+_DECIMAL_FORMATS = tuple(f"{{:.{digits}f}}".format for digits in range(10))
+
+_DIGITS = _alphabet_table(string.digits)
+_UPPERCASE = _alphabet_table(string.ascii_uppercase)
+_LOWERCASE = _alphabet_table(string.ascii_lowercase)
+_ALPHANUMERIC = _alphabet_table(string.ascii_uppercase + string.digits)
+# VINs never use I, O or Q
+_VIN_CHARS = _alphabet_table("ABCDEFGHJKLMNPRSTUVWXYZ0123456789")
+
 
 class ValueGeneratorRegistry:
     """
@@ -32,50 +81,57 @@ class ValueGeneratorRegistry:
             seed: Optional random seed for reproducibility
         """
         self.faker = Faker()
+        # Own RNGs so seeded runs don't depend on (or reseed) the global streams, which
+        # concurrent lanes would otherwise interleave
+        self._rng = random.Random(seed)
         if seed is not None:
-            Faker.seed(seed)
-            random.seed(seed)
+            self.faker.seed_instance(seed)
 
         self._generators: dict[str, Callable[[], str]] = {}
+        self._pattern_plans: dict[str, list[tuple[str, Any]]] = {}
         self._register_defaults()
 
     def _register_defaults(self) -> None:
         """Register built-in semantic generators."""
         f = self.faker
+        rng = self._rng
+
+        # Store bound methods/partials where possible so generating a value
+        # doesn't go through an extra lambda frame
 
         self._generators.update(
             {
                 # Person names
-                "person.first_name": lambda: f.first_name(),
-                "person.last_name": lambda: f.last_name(),
-                "person.full_name": lambda: f.name(),
-                "person.prefix": lambda: f.prefix(),
-                "person.suffix": lambda: f.suffix(),
+                "person.first_name": self._element_picker(f.first_name, "first_names"),
+                "person.last_name": self._element_picker(f.last_name, "last_names"),
+                "person.full_name": f.name,
+                "person.prefix": f.prefix,
+                "person.suffix": f.suffix,
                 # Identification
-                "ssn": lambda: f.ssn(),
+                "ssn": f.ssn,
                 "ssn.masked": lambda: f"XXX-XX-{f.random_number(digits=4, fix_len=True)}",
                 # Contact info
-                "email": lambda: f.email(),
-                "phone_number": lambda: f.phone_number(),
-                "phone.mobile": lambda: f.phone_number(),
-                "phone.landline": lambda: f.phone_number(),
+                "email": f.email,
+                "phone_number": f.phone_number,
+                "phone.mobile": f.phone_number,
+                "phone.landline": f.phone_number,
                 # Address
-                "address.street": lambda: f.street_address(),
-                "address.street1": lambda: f.street_address(),
-                "address.street2": lambda: f.secondary_address(),
-                "address.city": lambda: f.city(),
-                "address.state": lambda: f.state(),
-                "address.state_abbr": lambda: f.state_abbr(),
-                "address.zipcode": lambda: f.zipcode(),
-                "address.zip": lambda: f.zipcode(),
-                "address.country": lambda: f.country(),
-                "address.full": lambda: f.address(),
+                "address.street": f.street_address,
+                "address.street1": f.street_address,
+                "address.street2": f.secondary_address,
+                "address.city": f.city,
+                "address.state": f.state,
+                "address.state_abbr": f.state_abbr,
+                "address.zipcode": f.zipcode,
+                "address.zip": f.zipcode,
+                "address.country": f.country,
+                "address.full": f.address,
                 # Financial
-                "account.number": lambda: f.bban(),
-                "routing.number": lambda: f.aba(),
-                "credit_card.number": lambda: f.credit_card_number(),
-                "currency.code": lambda: f.currency_code(),
-                "currency.amount": lambda: str(round(random.uniform(0, 10000), 2)),
+                "account.number": f.bban,
+                "routing.number": f.aba,
+                "credit_card.number": f.credit_card_number,
+                "currency.code": f.currency_code,
+                "currency.amount": lambda: str(round(rng.uniform(0, 10000), 2)),
                 # Dates
                 "date.past": lambda: f.date_this_decade().isoformat(),
                 "date.future": lambda: f.future_date().isoformat(),
@@ -84,45 +140,63 @@ class ValueGeneratorRegistry:
                 "datetime.past": lambda: f.date_time_this_decade().isoformat(),
                 "datetime.future": lambda: f.future_datetime().isoformat(),
                 # Company/business
-                "company.name": lambda: f.company(),
-                "company.suffix": lambda: f.company_suffix(),
-                "job.title": lambda: f.job(),
+                "company.name": f.company,
+                "company.suffix": f.company_suffix,
+                "job.title": f.job,
                 # Internet
-                "url": lambda: f.url(),
-                "domain": lambda: f.domain_name(),
-                "username": lambda: f.user_name(),
-                "ipv4": lambda: f.ipv4(),
+                "url": f.url,
+                "domain": f.domain_name,
+                "username": f.user_name,
+                "ipv4": f.ipv4,
                 # Text
-                "text.word": lambda: f.word(),
-                "text.sentence": lambda: f.sentence(),
-                "text.paragraph": lambda: f.paragraph(),
+                "text.word": f.word,
+                "text.sentence": f.sentence,
+                "text.paragraph": f.paragraph,
                 # Codes/IDs
-                "uuid": lambda: f.uuid4(),
-                "code.alpha": lambda: "".join(random.choices(string.ascii_uppercase, k=6)),
-                "code.numeric": lambda: "".join(random.choices(string.digits, k=8)),
-                "code.alphanumeric": lambda: "".join(
-                    random.choices(string.ascii_uppercase + string.digits, k=8)
-                ),
+                "uuid": f.uuid4,
+                "code.alpha": partial(_random_chars, rng, _UPPERCASE, 6),
+                "code.numeric": partial(_random_chars, rng, _DIGITS, 8),
+                "code.alphanumeric": partial(_random_chars, rng, _ALPHANUMERIC, 8),
                 # Vehicle
-                "vehicle.vin": lambda: self._generate_vin(),
-                "vehicle.make": lambda: random.choice(
-                    ["Toyota", "Honda", "Ford", "Chevrolet", "BMW", "Mercedes", "Audi", "Tesla"]
+                "vehicle.vin": self._generate_vin,
+                "vehicle.make": partial(
+                    rng.choice,
+                    ("Toyota", "Honda", "Ford", "Chevrolet", "BMW", "Mercedes", "Audi", "Tesla"),
                 ),
-                "vehicle.model": lambda: random.choice(
-                    ["Sedan", "SUV", "Truck", "Coupe", "Hatchback", "Convertible", "Minivan"]
+                "vehicle.model": partial(
+                    rng.choice,
+                    ("Sedan", "SUV", "Truck", "Coupe", "Hatchback", "Convertible", "Minivan"),
                 ),
-                "vehicle.year": lambda: str(random.randint(2010, 2025)),
+                "vehicle.year": lambda: str(rng.randint(2010, 2025)),
                 # Boolean-ish
-                "boolean": lambda: random.choice(["true", "false"]),
-                "yes_no": lambda: random.choice(["Yes", "No"]),
-                "y_n": lambda: random.choice(["Y", "N"]),
+                "boolean": partial(rng.choice, ("true", "false")),
+                "yes_no": partial(rng.choice, ("Yes", "No")),
+                "y_n": partial(rng.choice, ("Y", "N")),
             }
         )
 
+    def _element_picker(self, method: Callable[[], str], attribute: str) -> Callable[[], str]:
+        """
+        Draw from the element table behind a Faker method directly.
+
+        Faker rebuilds the cumulative weights of tables like first_names
+        (hundreds of weighted entries) on every call; here they are computed
+        once and sampled with this registry's RNG. Falls back to the Faker
+        method when the locale's provider has no such table.
+        """
+        elements = getattr(getattr(method, "__self__", None), attribute, None)
+        if isinstance(elements, dict):
+            population = tuple(elements)
+            cum_weights = tuple(itertools.accumulate(elements.values()))
+            choices = self._rng.choices
+            return lambda: choices(population, cum_weights=cum_weights)[0]
+        if elements:
+            return partial(self._rng.choice, tuple(elements))
+        return method
+
     def _generate_vin(self) -> str:
         """Generate a VIN-like string."""
-        chars = "ABCDEFGHJKLMNPRSTUVWXYZ0123456789"
-        return "".join(random.choices(chars, k=17))
+        return _random_chars(self._rng, _VIN_CHARS, 17)
 
     def generate(self, semantic_type: str) -> str:
         """
@@ -135,22 +209,30 @@ class ValueGeneratorRegistry:
         Returns:
             Generated string value
         """
+        return self.resolve(semantic_type)()
+
+    def resolve(self, semantic_type: str) -> Callable[[], str]:
+        """
+        Resolve a semantic type to a zero-argument value generator.
+
+        Lets callers that generate the same type repeatedly do the type
+        dispatch once; calling the result is equivalent to generate().
+        """
         # Handle parameterized types
         if "(" in semantic_type:
-            return self._generate_parameterized(semantic_type)
+            return partial(self._generate_parameterized, semantic_type)
 
         # Handle pattern: prefix
         if semantic_type.startswith("pattern:"):
-            pattern = semantic_type[8:]
-            return self._generate_from_pattern(pattern)
+            return partial(self._generate_from_pattern, semantic_type[8:])
 
         # Look up in registry
         generator = self._generators.get(semantic_type)
         if generator:
-            return generator()
+            return generator
 
         # Fallback to random string
-        return self.faker.pystr(max_chars=20)
+        return partial(self.faker.pystr, max_chars=20)
 
     def _generate_parameterized(self, semantic_type: str) -> str:
         """Generate value for parameterized semantic type."""
@@ -169,31 +251,33 @@ class ValueGeneratorRegistry:
             min_val = float(params[0]) if len(params) > 0 else 0
             max_val = float(params[1]) if len(params) > 1 else 10000
             decimals = int(params[2]) if len(params) > 2 else 2
-            value = random.uniform(min_val, max_val)
+            value = self._rng.uniform(min_val, max_val)
+            if 0 <= decimals < len(_DECIMAL_FORMATS):
+                return _DECIMAL_FORMATS[decimals](value)
             return f"{value:.{decimals}f}"
 
         elif func_name == "integer":
             # integer(min, max)
             min_val = int(params[0]) if len(params) > 0 else 0
             max_val = int(params[1]) if len(params) > 1 else 1000
-            return str(random.randint(min_val, max_val))
+            return str(self._rng.randint(min_val, max_val))
 
         elif func_name == "choice":
             # choice(val1, val2, val3, ...)
-            return random.choice(params) if params else ""
+            return self._rng.choice(params) if params else ""
 
         elif func_name == "date":
             # date(days_from_now_min, days_from_now_max)
             min_days = int(params[0]) if len(params) > 0 else -365
             max_days = int(params[1]) if len(params) > 1 else 365
-            days = random.randint(min_days, max_days)
+            days = self._rng.randint(min_days, max_days)
             return (date.today() + timedelta(days=days)).isoformat()
 
         elif func_name == "year":
             # year(min, max)
             min_year = int(params[0]) if len(params) > 0 else 2000
             max_year = int(params[1]) if len(params) > 1 else 2025
-            return str(random.randint(min_year, max_year))
+            return str(self._rng.randint(min_year, max_year))
 
         elif func_name == "string":
             # string(length) or string(min_length, max_length)
@@ -202,7 +286,7 @@ class ValueGeneratorRegistry:
             else:
                 min_len = int(params[0]) if len(params) > 0 else 5
                 max_len = int(params[1]) if len(params) > 1 else 20
-                length = random.randint(min_len, max_len)
+                length = self._rng.randint(min_len, max_len)
             return self.faker.pystr(max_chars=length)[:length]
 
         return self.faker.pystr(max_chars=20)
@@ -219,49 +303,60 @@ class ValueGeneratorRegistry:
             {######} - N random digits
             {AAAAAA} - N random uppercase letters
             {seq:N} - N-digit sequential number (random for now)
+
+        Year, month and day are drawn once per value, so e.g. {YYYY} and
+        {YY} in the same pattern agree.
         """
-        result = pattern
-
-        # Year placeholders
-        year = str(random.randint(2020, 2025))
-        result = result.replace("{YYYY}", year)
-        result = result.replace("{YY}", year[2:])
-
-        # Month/day placeholders
-        result = result.replace("{MM}", f"{random.randint(1, 12):02d}")
-        result = result.replace("{DD}", f"{random.randint(1, 28):02d}")
-
-        # Digit placeholders (e.g., {######})
-        while "{#" in result:
-            match = re.search(r"\{(#+)\}", result)
-            if match:
-                count = len(match.group(1))
-                digits = "".join(random.choices(string.digits, k=count))
-                result = result.replace(match.group(0), digits, 1)
-            else:
-                break
-
-        # Letter placeholders (e.g., {AAAAAA})
-        while "{A" in result:
-            match = re.search(r"\{(A+)\}", result)
-            if match:
-                count = len(match.group(1))
-                letters = "".join(random.choices(string.ascii_uppercase, k=count))
-                result = result.replace(match.group(0), letters, 1)
+        segments = self._pattern_plans.get(pattern)
+        if segments is None:
+            segments = self._pattern_plans[pattern] = self._compile_pattern(pattern)
+
+        rng = self._rng
+        year = month = day = None
+        parts: list[str] = []
+        for kind, value in segments:
+            if kind == "literal":
+                parts.append(value)
+            elif kind == "digits":
+                parts.append(_random_chars(rng, _DIGITS, value))
+            elif kind == "letters":
+                parts.append(_random_chars(rng, _UPPERCASE, value))
+            elif kind == "MM":
+                if month is None:
+                    month = f"{rng.randint(1, 12):02d}"
+                parts.append(month)
+            elif kind == "DD":
+                if day is None:
+                    day = f"{rng.randint(1, 28):02d}"
+                parts.append(day)
             else:
-                break
-
-        # Sequential placeholder
-        while "{seq:" in result:
-            match = re.search(r"\{seq:(\d+)\}", result)
-            if match:
-                digits = int(match.group(1))
-                seq = "".join(random.choices(string.digits, k=digits))
-                result = result.replace(match.group(0), seq, 1)
+                if year is None:
+                    year = str(rng.randint(2020, 2025))
+                parts.append(year if kind == "YYYY" else year[2:])
+
+        return "".join(parts)
+
+    @staticmethod
+    def _compile_pattern(pattern: str) -> list[tuple[str, Any]]:
+        """Split a pattern template into literal text and placeholder segments."""
+        segments: list[tuple[str, Any]] = []
+        pos = 0
+        for match in _PATTERN_PLACEHOLDER.finditer(pattern):
+            if match.start() > pos:
+                segments.append(("literal", pattern[pos:match.start()]))
+            token = match.group(1)
+            if token.startswith("#"):
+                segments.append(("digits", len(token)))
+            elif token.startswith("A"):
+                segments.append(("letters", len(token)))
+            elif token.startswith("seq:"):
+                segments.append(("digits", int(token[4:])))
             else:
-                break
-
-        return result
+                segments.append((token, None))
+            pos = match.end()
+        if pos < len(pattern):
+            segments.append(("literal", pattern[pos:]))
+        return segments
 
     def has_semantic_type(self, semantic_type: str) -> bool:
         """Check if a semantic type is registered."""
@@ -279,9 +374,25 @@ class XsdTypeValueGenerator:
 
     def __init__(self, seed: int | None = None):
         self.faker = Faker()
+        self._rng = random.Random(seed)
         if seed is not None:
-            Faker.seed(seed)
-            random.seed(seed)
+            self.faker.seed_instance(seed)
+
+        # Lower-cased XSD base type -> generator; anything else is a string
+        self._base_type_generators: dict[str, Callable[[XsdSimpleType], str]] = {
+            "integer": self._generate_integer,
+            "int": self._generate_integer,
+            "long": self._generate_integer,
+            "short": self._generate_integer,
+            "byte": self._generate_integer,
+            "decimal": self._generate_decimal,
+            "float": self._generate_decimal,
+            "double": self._generate_decimal,
+            "date": self._generate_date,
+            "datetime": self._generate_datetime,
+            "boolean": self._generate_boolean,
+        }
+        self._simple_patterns: dict[str, tuple[tuple[bytes, bytes], int] | None] = {}
 
     def generate(self, type_def: XsdSimpleType | None) -> str:
         """
@@ -293,33 +404,29 @@ class XsdTypeValueGenerator:
             3. Base type with facets - respect min/max/length
             4. Base type fallback
         """
+        return self.resolve(type_def)()
+
+    def resolve(self, type_def: XsdSimpleType | None) -> Callable[[], str]:
+        """
+        Resolve a type definition to a zero-argument value generator.
+
+        Follows the same priority as generate(), evaluated once.
+        """
         if type_def is None:
-            return self.faker.pystr(max_chars=20)
+            return partial(self.faker.pystr, max_chars=20)
 
         # 1. Enumeration
         if type_def.enumeration:
-            return random.choice(type_def.enumeration)
+            return partial(self._rng.choice, type_def.enumeration)
 
         # 2. Pattern (limited support)
         if type_def.pattern:
-            return self._generate_from_regex_pattern(type_def.pattern)
+            return partial(self._generate_from_regex_pattern, type_def.pattern)
 
         # 3. Base type with constraints
         base = type_def.base_type.lower() if type_def.base_type else "string"
-
-        if base in ("integer", "int", "long", "short", "byte"):
-            return self._generate_integer(type_def)
-        elif base in ("decimal", "float", "double"):
-            return self._generate_decimal(type_def)
-        elif base in ("date",):
-            return self._generate_date(type_def)
-        elif base in ("datetime", "dateTime"):
-            return self._generate_datetime(type_def)
-        elif base in ("boolean",):
-            return random.choice(["true", "false"])
-        else:
-            # String or unknown
-            return self._generate_string(type_def)
+        generator = self._base_type_generators.get(base, self._generate_string)
+        return partial(generator, type_def)
 
     def _generate_integer(self, type_def: XsdSimpleType) -> str:
         """Generate an integer value."""
@@ -330,7 +437,7 @@ class XsdTypeValueGenerator:
             max_by_digits = 10 ** type_def.total_digits - 1
             max_val = min(max_val, max_by_digits)
 
-        return str(random.randint(min_val, max_val))
+        return str(self._rng.randint(min_val, max_val))
 
     def _generate_decimal(self, type_def: XsdSimpleType) -> str:
         """Generate a decimal value."""
@@ -339,7 +446,9 @@ class XsdTypeValueGenerator:
 
         decimals = type_def.fraction_digits if type_def.fraction_digits is not None else 2
 
-        value = random.uniform(min_val, max_val)
+        value = self._rng.uniform(min_val, max_val)
+        if 0 <= decimals < len(_DECIMAL_FORMATS):
+            return _DECIMAL_FORMATS[decimals](value)
         return f"{value:.{decimals}f}"
 
     def _generate_date(self, type_def: XsdSimpleType) -> str:
@@ -350,16 +459,20 @@ class XsdTypeValueGenerator:
         """Generate a datetime value."""
         return self.faker.date_time_this_decade().isoformat()
 
+    def _generate_boolean(self, type_def: XsdSimpleType) -> str:
+        """Generate a boolean value."""
+        return self._rng.choice(("true", "false"))
+
     def _generate_string(self, type_def: XsdSimpleType) -> str:
         """Generate a string value."""
         min_len = type_def.min_length or 1
         max_len = type_def.max_length or 50
 
-        length = random.randint(min_len, max_len)
+        length = self._rng.randint(min_len, max_len)
         result = self.faker.pystr(min_chars=max(1, length), max_chars=max(length, 1))
         # Ensure we return something, trimmed to desired length
         if not result:
-            result = "".join(random.choices("abcdefghijklmnopqrstuvwxyz", k=length))
+            result = _random_chars(self._rng, _LOWERCASE, length)
         return result[:length] if len(result) > length else result
 
     def _generate_from_regex_pattern(self, pattern: str) -> str:
@@ -369,26 +482,26 @@ class XsdTypeValueGenerator:
         This is a simplified implementation that handles common patterns.
         For full regex support, use the exrex library.
         """
-        try:
-            import exrex
-
+        if exrex is not None:
             return exrex.getone(pattern, limit=50)
-        except ImportError:
-            # Fallback to simple patterns
-            pass
-
-        # Handle simple common patterns
-        result = ""
 
-        # [A-Z]{3} style
-        if re.match(r"^\[A-Z\]\{(\d+)\}$", pattern):
-            count = int(re.search(r"\{(\d+)\}", pattern).group(1))
-            return "".join(random.choices(string.ascii_uppercase, k=count))
+        # Handle simple common patterns, classified once per distinct pattern
+        if pattern not in self._simple_patterns:
+            self._simple_patterns[pattern] = self._classify_simple_pattern(pattern)
 
-        # [0-9]{N} style
-        if re.match(r"^\[0-9\]\{(\d+)\}$", pattern):
-            count = int(re.search(r"\{(\d+)\}", pattern).group(1))
-            return "".join(random.choices(string.digits, k=count))
+        simple = self._simple_patterns[pattern]
+        if simple is not None:
+            alphabet, count = simple
+            return _random_chars(self._rng, alphabet, count)
 
         # Fallback
         return self.faker.pystr(max_chars=20)
+
+    @staticmethod
+    def _classify_simple_pattern(pattern: str) -> tuple[tuple[bytes, bytes], int] | None:
+        """Resolve [A-Z]{N} / [0-9]{N} style patterns to (alphabet, length)."""
+        match = _SIMPLE_REGEX_PATTERN.fullmatch(pattern)
+        if not match:
+            return None
+        alphabet = _UPPERCASE if match.group(1) == "A-Z" else _DIGITS
+        return alphabet, int(match.group(2))
@@ -14,8 +14,11 @@ from typing import Any
 
 import yaml
 
+# libyaml's C loader when PyYAML was built with it; same safe subset, much faster
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+
+@dataclass(slots=True)
 class FieldOverride:
     """Override settings for a specific field path."""
 
@@ -24,7 +27,7 @@ class FieldOverride:
     semantic_type: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationDefaults:
     """Default generation settings."""
 
@@ -34,7 +37,7 @@ class GenerationDefaults:
     repeat_range: tuple[int, int] = (1, 3)
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationConfig:
     """Generation configuration section."""
 
@@ -43,7 +46,7 @@ class GenerationConfig:
     field_overrides: dict[str, FieldOverride] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextConfig:
     """Context configuration section.
 
@@ -59,7 +62,7 @@ class ContextConfig:
     optional_metadata: dict[str, list[str]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class MetaConfig:
     """Complete meta file configuration."""
 
@@ -85,8 +88,9 @@ def load_meta_config(meta_path: Path) -> MetaConfig:
     if not meta_path.exists():
         raise FileNotFoundError(f"Meta file not found: {meta_path}")
 
-    with open(meta_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    # Read bytes and let the loader handle the UTF-8 decoding
+    with open(meta_path, "rb") as f:
+        data = yaml.load(f, Loader=_SafeLoader)
 
     if not data:
         raise ValueError(f"Empty meta file: {meta_path}")
@@ -7,9 +7,10 @@ and submits them as observations to the API.
 
 import random
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator
+from typing import Iterable
 
 from .api.client import TestGenApiClient, SubmissionResult
 from .generation.distributions import DistributionConfig
@@ -17,6 +18,12 @@ from .generation.generator import XmlGenerator, XmlValidator
 from .meta.config import MetaConfig, load_meta_config
 from .xsd.parser import parse_xsd
 
+try:
+    # Optional progress bars; lanes run without one when tqdm isn't installed
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None  # type: ignore[assignment]
+
 
 @dataclass
 class TestLane:
@@ -78,6 +85,7 @@ class TestLaneRunner:
         fill_rate_override: float | None = None,
         seed: int | None = None,
         verbose: bool = False,
+        jobs: int = 1,
     ):
         """
         Initialize the runner.
@@ -91,6 +99,7 @@ class TestLaneRunner:
             fill_rate_override: Override fill rate for optional fields
             seed: Random seed for reproducibility
             verbose: Enable verbose output
+            jobs: Maximum number of lanes to run concurrently
         """
         self.lanes_dir = lanes_dir
         self.api_url = api_url
@@ -100,9 +109,7 @@ class TestLaneRunner:
         self.fill_rate_override = fill_rate_override
         self.seed = seed
         self.verbose = verbose
-
-        if seed is not None:
-            random.seed(seed)
+        self.jobs = max(1, jobs)
 
     def discover_lanes(self) -> list[TestLane]:
         """
@@ -160,25 +167,24 @@ class TestLaneRunner:
         """
         all_lanes = self.discover_lanes()
 
-        # Match lane names
-        selected_lanes: list[TestLane] = []
+        # Match lane names; a lane's name is part of its full name, so one substring
+        # test covers both. Keyed by full name so a lane matched twice runs once, in
+        # the order it was first matched
+        selected_lanes: dict[str, TestLane] = {}
         for name in lane_names:
-            matched = [l for l in all_lanes if name in l.full_name or name == l.name]
+            matched = False
+            for lane in all_lanes:
+                if name in lane.full_name:
+                    selected_lanes.setdefault(lane.full_name, lane)
+                    matched = True
             if not matched:
                 self._print(f"Warning: No lane matching '{name}'")
-            selected_lanes.extend(matched)
 
         if not selected_lanes:
             self._print("No matching test lanes found")
             return 1
 
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_lanes = []
-        for lane in selected_lanes:
-            if lane.full_name not in seen:
-                seen.add(lane.full_name)
-                unique_lanes.append(lane)
+        unique_lanes = list(selected_lanes.values())
 
         self._print(f"Running {len(unique_lanes)} test lane(s)")
 
@@ -202,16 +208,19 @@ class TestLaneRunner:
                 self._print(f"Warning: API at {self.api_url} may not be reachable")
 
         try:
-            for lane in lanes:
-                result = self._run_lane(lane, api_client)
-                lane_results.append(result)
-                total_generated += result.total_generated
-                total_observations += result.total_observations
+            if self.jobs > 1 and len(lanes) > 1:
+                lane_results = self._run_lanes_concurrently(lanes, api_client)
+            else:
+                lane_results = [self._run_lane(lane, api_client) for lane in lanes]
 
         finally:
             if api_client:
                 api_client.close()
 
+        for result in lane_results:
+            total_generated += result.total_generated
+            total_observations += result.total_observations
+
         return RunResult(
             lanes_run=len(lanes),
             lanes_succeeded=sum(1 for r in lane_results if r.success),
@@ -220,6 +229,38 @@ class TestLaneRunner:
             lane_results=lane_results,
         )
 
+    def _run_lanes_concurrently(
+        self, lanes: list[TestLane], api_client: TestGenApiClient | None
+    ) -> list[LaneResult]:
+        """
+        Run lanes on up to `jobs` threads, returning results in lane order.
+
+        Lanes are grouped by context and each group runs on one thread, one lane
+        after another, so a context never has more than one submission outstanding.
+        """
+        groups: dict[str | None, list[int]] = {}
+        for index, lane in enumerate(lanes):
+            try:
+                context_id = load_meta_config(lane.meta_path).context.context_id
+            except Exception:
+                # _run_lane reports the error when it loads the file itself
+                context_id = None
+            groups.setdefault(context_id, []).append(index)
+
+        results: list[LaneResult | None] = [None] * len(lanes)
+
+        def run_group(indexes: list[int]) -> None:
+            for index in indexes:
+                results[index] = self._run_lane(lanes[index], api_client)
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.jobs, len(groups)), thread_name_prefix="testgen-lane"
+        ) as pool:
+            for future in [pool.submit(run_group, indexes) for indexes in groups.values()]:
+                future.result()
+
+        return [result for result in results if result is not None]
+
     def _run_lane(
         self, lane: TestLane, api_client: TestGenApiClient | None
     ) -> LaneResult:
@@ -254,11 +295,9 @@ class TestLaneRunner:
             self._print_verbose(f"  Parsed XSD with {len(schema.root_elements)} root element(s)")
 
             # Create distribution config
-            distribution = DistributionConfig.from_meta_config(meta_config.generation)
+            distribution = DistributionConfig.from_meta_config(meta_config.generation, seed=self.seed)
             if self.fill_rate_override is not None:
                 distribution.optional_field_fill_rate = self.fill_rate_override
-            if self.seed is not None:
-                distribution.seed = self.seed
 
             # Create validator
             validator = XmlValidator(lane.xsd_path)
@@ -281,64 +320,108 @@ class TestLaneRunner:
                 else:
                     base_metadata[key] = value
 
-            # Generate and submit XMLs
-            try:
-                from tqdm import tqdm
-
-                iterator: Iterator[int] = tqdm(
-                    range(self.count), desc=f"  Generating", leave=False
-                )
-            except ImportError:
-                iterator = range(self.count)
+            pending: tuple[int, Future[SubmissionResult]] | None = None
 
-            for i in iterator:
+            def collect_submission(index: int, future: Future[SubmissionResult]) -> None:
+                nonlocal submitted_count, observation_count
                 try:
-                    # Build metadata for this document
-                    metadata = base_metadata.copy()
-
-                    # Add random required metadata (required keys with list of values)
-                    for key, values in required_random_metadata.items():
-                        if values:
-                            metadata[key] = random.choice(values)
-
-                    # Add random optional metadata
-                    for key, values in meta_config.context.optional_metadata.items():
-                        if values:
-                            metadata[key] = random.choice(values)
-
-                    # Generate XML
-                    xml_string = generator.generate_string(pretty=True)
-                    generated_count += 1
-
-                    # Validate
-                    is_valid, validation_errors = validator.validate(xml_string)
-                    if not is_valid:
-                        errors.append(f"XML {i+1} failed validation: {validation_errors[0]}")
-                        continue
-
-                    # Save to file if output dir specified
-                    if self.output_dir:
-                        self._save_xml(lane, i, xml_string)
-
-                    # Submit if not dry run
-                    if api_client and not self.dry_run:
-                        result = api_client.submit_xml_observations(
-                            meta_config.context.context_id,
-                            xml_string,
-                            metadata,
-                        )
-                        if result.success:
-                            submitted_count += 1
-                            observation_count += result.observation_count
+                    result = future.result()
+                except Exception as e:
+                    errors.append(f"XML {index+1} submission failed: {e}")
+                    return
+                if result.success:
+                    submitted_count += 1
+                    observation_count += result.observation_count
+                else:
+                    errors.append(f"XML {index+1} submission failed: {result.error_message}")
+
+            # Draw every document's random metadata values up front, one batch per key,
+            # so the loop below only indexes into prepared columns. Each lane has its own
+            # RNG so seeded runs draw the same values whether or not lanes run concurrently
+            metadata_rng = random.Random(self.seed)
+            random_keys: list[str] = []
+            random_columns: list[list[str]] = []
+            for random_metadata in (
+                required_random_metadata,
+                meta_config.context.optional_metadata,
+            ):
+                for key, values in random_metadata.items():
+                    if values:
+                        random_keys.append(key)
+                        random_columns.append(metadata_rng.choices(values, k=self.count))
+
+            # Pretty-print only documents that are written out for people to read; the
+            # API receives observations extracted from the XML, which indentation
+            # doesn't change
+            output_path: Path | None = None
+            if self.output_dir:
+                output_path = self.output_dir / lane.full_name
+                output_path.mkdir(parents=True, exist_ok=True)
+
+            # Generate and submit XMLs, with a progress bar only on an interactive
+            # terminal and unless lanes run concurrently (their bars would overwrite
+            # each other)
+            iterator: Iterable[int] = range(self.count)
+            if tqdm is not None and self.jobs == 1 and sys.stderr.isatty():
+                iterator = tqdm(iterator, desc=f"  Generating", leave=False)
+
+            # Submissions run on one background thread so the next document is generated
+            # while the previous one is in flight. Each submission is collected before the
+            # next is started, so a context never has more than one request outstanding
+            # and results are recorded in document order.
+            submitter: ThreadPoolExecutor | None = None
+            if api_client and not self.dry_run:
+                submitter = ThreadPoolExecutor(max_workers=1, thread_name_prefix="testgen-submit")
+
+            try:
+                for i in iterator:
+                    try:
+                        # Build metadata for this document; optional keys follow required
+                        # ones, so an optional value wins if a key appears in both
+                        metadata = base_metadata.copy()
+                        metadata.update(zip(random_keys, [column[i] for column in random_columns]))
+
+                        # Generate XML
+                        root = generator.generate()
+                        generated_count += 1
+
+                        # Validate the tree before serializing it
+                        is_valid, validation_errors = validator.validate_element(root)
+                        if not is_valid:
+                            errors.append(f"XML {i+1} failed validation: {validation_errors[0]}")
+                            continue
+
+                        xml_string = generator.to_string(root, pretty=output_path is not None)
+
+                        # Save to file if output dir specified
+                        if output_path is not None:
+                            self._save_xml(output_path, lane, i, xml_string)
+
+                        # Submit if not dry run
+                        if api_client and submitter is not None:
+                            if pending is not None:
+                                collect_submission(*pending)
+                            pending = (i, submitter.submit(
+                                api_client.submit_xml_observations,
+                                meta_config.context.context_id,
+                                xml_string,
+                                metadata,
+                            ))
                         else:
-                            errors.append(f"XML {i+1} submission failed: {result.error_message}")
-                    else:
-                        submitted_count += 1  # Count as submitted in dry run
+                            submitted_count += 1  # Count as submitted in dry run
 
-                except Exception as e:
-                    errors.append(f"XML {i+1} generation failed: {e}")
+                    except Exception as e:
+                        errors.append(f"XML {i+1} generation failed: {e}")
+            finally:
+                # Collect the last submission and stop the thread even if the loop
+                # raised, so an in-flight result is still recorded
+                if pending is not None:
+                    collect_submission(*pending)
+                if submitter is not None:
+                    submitter.shutdown()
 
-            self._print(f"  Generated: {generated_count}, Submitted: {submitted_count}")
+            prefix = f"  {lane.full_name}:" if self.jobs > 1 else " "
+            self._print(f"{prefix} Generated: {generated_count}, Submitted: {submitted_count}")
 
         except FileNotFoundError as e:
             errors.append(f"File not found: {e}")
@@ -357,26 +440,23 @@ class TestLaneRunner:
             errors=errors,
         )
 
-    def _save_xml(self, lane: TestLane, index: int, xml_string: str) -> None:
-        """Save generated XML to output directory."""
-        if not self.output_dir:
-            return
-
-        output_path = self.output_dir / lane.full_name
-        output_path.mkdir(parents=True, exist_ok=True)
-
+    def _save_xml(
+        self, output_path: Path, lane: TestLane, index: int, xml_string: str
+    ) -> None:
+        """Save generated XML to the lane's output directory."""
         file_path = output_path / f"{lane.name}_{index+1:04d}.xml"
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(xml_string)
+        # Encoded once and written in one call, without a text layer
+        file_path.write_bytes(xml_string.encode("utf-8"))
 
     def _print(self, message: str) -> None:
         """Print a message."""
-        print(message, file=sys.stderr)
+        # One write per line, so lines from concurrent lanes don't run together
+        sys.stderr.write(f"{message}\n")
 
     def _print_verbose(self, message: str) -> None:
         """Print a message if verbose mode is enabled."""
         if self.verbose:
-            print(message, file=sys.stderr)
+            self._print(message)
 
     def _print_summary(self, result: RunResult) -> None:
         """Print a summary of the run."""
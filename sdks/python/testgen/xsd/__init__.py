@@ -7,7 +7,7 @@ from .model import (
     XsdSimpleType,
     XsdComplexType,
 )
-from .parser import parse_xsd, extract_field_paths
+from .parser import parse_xsd, extract_field_paths, load_xml_schema
 
 __all__ = [
     "XsdSchema",
@@ -17,4 +17,5 @@ __all__ = [
     "XsdComplexType",
     "parse_xsd",
     "extract_field_paths",
+    "load_xml_schema",
 ]
@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class XsdSimpleType:
     """
     Represents an XSD simple type with optional restrictions.
@@ -30,7 +30,7 @@ class XsdSimpleType:
     fraction_digits: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class XsdAttribute:
     """
     Represents an XML attribute definition.
@@ -43,7 +43,7 @@ class XsdAttribute:
     fixed: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class XsdElement:
     """
     Represents an XML element definition.
@@ -86,7 +86,7 @@ class XsdElement:
         return self.max_occurs is None or self.max_occurs > 1
 
 
-@dataclass
+@dataclass(slots=True)
 class XsdComplexType:
     """
     Represents a named complex type definition.
@@ -101,7 +101,7 @@ class XsdComplexType:
     mixed: bool = False  # Mixed content (text + elements)
 
 
-@dataclass
+@dataclass(slots=True)
 class XsdSchema:
     """
     Represents a complete XSD schema.
@@ -5,6 +5,8 @@ Parses XSD files into the internal model representation used for
 XML generation.
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -26,6 +28,28 @@ from .model import (
 )
 
 
+@lru_cache(maxsize=32)
+def _compile_xml_schema(xsd_path: str, mtime_ns: int) -> xmlschema.XMLSchema:
+    """Build (once per file version) the xmlschema object for an XSD file."""
+    return xmlschema.XMLSchema(xsd_path)
+
+
+def load_xml_schema(xsd_path: Path) -> xmlschema.XMLSchema:
+    """
+    Load the compiled xmlschema object for an XSD file.
+
+    Compiled schemas are cached by path and modification time, so parsing
+    and validating the same unchanged file build it only once.
+
+    Args:
+        xsd_path: Path to the XSD file
+
+    Returns:
+        Compiled XMLSchema object
+    """
+    return _compile_xml_schema(str(xsd_path), os.stat(xsd_path).st_mtime_ns)
+
+
 def parse_xsd(xsd_path: Path) -> XsdSchema:
     """
     Parse an XSD file into the internal schema model.
@@ -44,7 +68,7 @@ def parse_xsd(xsd_path: Path) -> XsdSchema:
         raise FileNotFoundError(f"XSD file not found: {xsd_path}")
 
     # Parse with xmlschema library
-    xml_schema = xmlschema.XMLSchema(str(xsd_path))
+    xml_schema = load_xml_schema(xsd_path)
 
     schema = XsdSchema(
         target_namespace=xml_schema.target_namespace,
@@ -0,0 +1,201 @@
+"""Tests for the test generation API client."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from testgen.api import client as client_module
+from testgen.meta.config import ContextConfig
+
+
+OBSERVATIONS = [
+    {
+        "metadata": {"productCode": "DDA"},
+        "fieldPath": "/Root/Name",
+        "count": 2,
+        "hasNull": False,
+        "hasEmpty": True,
+    }
+]
+
+
+def _response(status_code: int, content: bytes = b"") -> Mock:
+    response = Mock()
+    response.status_code = status_code
+    response.content = content
+    response.text = content.decode("utf-8")
+    return response
+
+
+@pytest.fixture
+def api_client():
+    """Client whose session is a mock."""
+    api_client = client_module.TestGenApiClient("http://localhost:8080/", retry_delay=0)
+    api_client.session = Mock()
+    return api_client
+
+
+class TestJsonCodec:
+    """Tests for request and response (de)serialization."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_submit_observations_sends_json_body(self, api_client, use_orjson):
+        """Test that observations are posted as a JSON body with or without orjson."""
+        if use_orjson and client_module.orjson is None:
+            pytest.skip("orjson not installed")
+
+        api_client.session.post.return_value = _response(204)
+        with patch.object(client_module, "orjson", client_module.orjson if use_orjson else None):
+            result = api_client.submit_observations("ctx", OBSERVATIONS)
+
+        assert result.success
+        args, kwargs = api_client.session.post.call_args
+        assert args[0] == "http://localhost:8080/catalog/contexts/ctx/observations"
+        assert kwargs["headers"] == {"Content-Type": "application/json"}
+        assert json.loads(kwargs["data"]) == OBSERVATIONS
+
+    def test_retries_resend_the_same_body(self, api_client):
+        """Test that a retried submission reuses the body serialized for the first attempt."""
+        api_client.session.post.side_effect = [_response(503), _response(200)]
+
+        result = api_client.submit_observations("ctx", OBSERVATIONS)
+
+        assert result.success
+        first, second = api_client.session.post.call_args_list
+        assert first.kwargs["data"] is second.kwargs["data"]
+
+    def test_get_context_parses_response(self, api_client):
+        """Test that a found context is decoded from the response body."""
+        api_client.session.get.return_value = _response(200, b'{"contextId":"ctx","active":true}')
+
+        assert api_client.get_context("ctx") == {"contextId": "ctx", "active": True}
+
+    def test_get_context_returns_none_on_invalid_json(self, api_client):
+        """Test that an unparseable body is treated like a missing context."""
+        api_client.session.get.return_value = _response(200, b"<html>")
+
+        assert api_client.get_context("ctx") is None
+
+
+class TestContexts:
+    """Tests for context existence checks."""
+
+    def test_context_exists_uses_head(self, api_client):
+        """Test that the existence check does not download the context."""
+        api_client.session.head.return_value = _response(200)
+
+        assert api_client.context_exists("ctx")
+        api_client.session.head.assert_called_once()
+        api_client.session.get.assert_not_called()
+
+    def test_ensure_context_exists_is_cached(self, api_client):
+        """Test that a context confirmed once is not checked again."""
+        api_client.session.head.return_value = _response(404)
+        api_client.session.post.return_value = _response(201)
+        config = ContextConfig(context_id="ctx")
+
+        assert api_client.ensure_context_exists(config)
+        assert api_client.ensure_context_exists(config)
+
+        assert api_client.session.head.call_count == 1
+        assert api_client.session.post.call_count == 1
+
+    def test_failed_creation_is_not_cached(self, api_client):
+        """Test that a context that could not be created is checked again next time."""
+        api_client.session.head.return_value = _response(404)
+        api_client.session.post.return_value = _response(500, b"down")
+        config = ContextConfig(context_id="ctx")
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                api_client.ensure_context_exists(config)
+
+        assert api_client.session.head.call_count == 2
+
+
+class TestSubmitRetries:
+    """Tests for the submission retry loop."""
+
+    def test_server_errors_exhaust_into_result(self, api_client):
+        """Test that persistent 5xx responses end in a failed result, not an exception."""
+        api_client.session.post.return_value = _response(503, b"busy")
+
+        result = api_client.submit_observations("ctx", OBSERVATIONS)
+
+        assert not result.success
+        assert result.error_message == "Server error: 503 - busy"
+        assert api_client.session.post.call_count == api_client.max_retries
+
+    def test_error_message_quotes_bounded_body(self, api_client):
+        """Test that a large error page is truncated in the result message."""
+        api_client.session.post.return_value = _response(400, b"x" * 100_000)
+
+        result = api_client.submit_observations("ctx", OBSERVATIONS)
+
+        assert result.error_message == "Client error: 400 - " + "x" * client_module._ERROR_BODY_LIMIT
+
+    def test_client_errors_are_not_retried(self, api_client):
+        """Test that a 4xx response fails immediately."""
+        api_client.session.post.return_value = _response(400, b"bad")
+
+        result = api_client.submit_observations("ctx", OBSERVATIONS)
+
+        assert result.error_message == "Client error: 400 - bad"
+        assert api_client.session.post.call_count == 1
+
+    def test_network_errors_are_retried(self, api_client):
+        """Test that a dropped connection is retried on the same session."""
+        api_client.session.post.side_effect = [requests.ConnectionError("reset"), _response(201)]
+
+        result = api_client.submit_observations("ctx", OBSERVATIONS)
+
+        assert result.success
+        assert result.observation_count == len(OBSERVATIONS)
+
+
+class TestExtractObservations:
+    """Tests for extract_observations_from_xml."""
+
+    def test_leaves_attributes_and_nil(self):
+        """Test paths and flags for leaves, attributes, xsi:nil and empty values."""
+        xml = (
+            '<ns:Root xmlns:ns="urn:test" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" id="1">'
+            '<ns:Name>Alice</ns:Name><Missing xsi:nil="true"/><Blank> </Blank><Name2 code=""/>'
+            "</ns:Root>"
+        )
+
+        observations = client_module.extract_observations_from_xml(xml, {"productCode": "DDA"})
+
+        by_path = {obs["fieldPath"]: obs for obs in observations}
+        assert list(by_path) == ["/Root/@id", "/Root/Name", "/Root/Missing", "/Root/Blank", "/Root/Name2", "/Root/Name2/@code"]
+        assert by_path["/Root/Missing"]["hasNull"] is True
+        assert by_path["/Root/Missing"]["hasEmpty"] is False
+        assert by_path["/Root/Blank"]["hasEmpty"] is True
+        assert by_path["/Root/Name2/@code"]["hasEmpty"] is True
+        assert all(obs["metadata"] == {"productCode": "DDA"} for obs in observations)
+
+    def test_repeated_elements_are_counted(self):
+        """Test that repeated leaves under repeated parents share one observation."""
+        xml = "<Root><Item><Id>1</Id></Item><Item><Id>2</Id></Item></Root>"
+
+        observations = client_module.extract_observations_from_xml(xml, {})
+
+        assert observations == [
+            {"metadata": {}, "fieldPath": "/Root/Item/Id", "count": 2, "hasNull": False, "hasEmpty": False}
+        ]
+
+    def test_deep_nesting_does_not_hit_recursion_limit(self):
+        """Test that nesting deeper than the interpreter recursion limit is extracted."""
+        depth = 2000
+        xml = "<N>" * depth + "leaf" + "</N>" * depth
+
+        observations = client_module.extract_observations_from_xml(xml, {})
+
+        assert len(observations) == 1
+        assert observations[0]["fieldPath"] == "/N" * depth
+
+    def test_invalid_xml_returns_empty(self):
+        """Test that malformed XML yields no observations."""
+        assert client_module.extract_observations_from_xml("<Root><Open></Root>", {}) == []
@@ -0,0 +1,39 @@
+"""Tests for the command-line interface."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from testgen import __version__
+from testgen.cli import create_parser
+
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+
+class TestCli:
+    """Tests for parser construction and startup cost."""
+
+    def test_importing_cli_defers_subcommand_dependencies(self):
+        """Test that the CLI module loads without the XSD, YAML, HTTP or runner stacks."""
+        heavy = ["testgen.runner", "testgen.xsd.parser", "testgen.meta.config", "xmlschema", "yaml", "requests"]
+        code = (
+            "import sys, testgen.cli; "
+            f"print(','.join(m for m in {heavy!r} if m in sys.modules))"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=PACKAGE_ROOT, capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == ""
+
+    def test_version_flag(self, capsys):
+        """Test that --version prints the package version and exits."""
+        with pytest.raises(SystemExit) as exc_info:
+            create_parser().parse_args(["--version"])
+
+        assert exc_info.value.code == 0
+        assert __version__ in capsys.readouterr().out
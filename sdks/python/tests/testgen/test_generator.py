@@ -1,5 +1,7 @@
 """Tests for the XML generator module."""
 
+import os
+import random
 import tempfile
 from pathlib import Path
 from xml.etree import ElementTree as ET
@@ -8,6 +10,7 @@ import pytest
 
 from testgen.generation.generator import XmlGenerator, XmlValidator, generate_xml_from_xsd
 from testgen.generation.distributions import DistributionConfig
+from testgen.xsd.model import XsdAttribute, XsdElement, XsdSchema, XsdSimpleType
 from testgen.xsd.parser import parse_xsd
 
 
@@ -156,6 +159,16 @@ class TestXmlGenerator:
         assert "<name" in xml_string
         assert "<value>" in xml_string or "<value/>" in xml_string
 
+    def test_generate_string_pretty_matches_compact(self, simple_schema_path):
+        """Test that pretty output is indented and carries the same content as compact output."""
+        schema = parse_xsd(simple_schema_path)
+
+        pretty = XmlGenerator(schema=schema, seed=7).generate_string(pretty=True)
+        compact = XmlGenerator(schema=schema, seed=7).generate_string(pretty=False)
+
+        assert pretty.startswith('<?xml version="1.0" encoding="UTF-8"?>\n<root>\n  <name')
+        assert ET.canonicalize(pretty, strip_text=True) == ET.canonicalize(compact, strip_text=True)
+
     def test_generate_complex_xml(self, complex_schema_path):
         """Test generating XML from a complex schema."""
         schema = parse_xsd(complex_schema_path)
@@ -247,6 +260,96 @@ class TestXmlGenerator:
         assert root.find("name") is not None
         assert root.find("value") is not None
 
+    def test_generate_deeper_than_recursion_limit(self):
+        """Test that deeply nested schemas don't exhaust the Python stack."""
+        depth = 3000
+        leaf = XsdElement(name="leaf", type_def=XsdSimpleType(base_type="integer"))
+        element = leaf
+        for level in range(depth):
+            element = XsdElement(name=f"level{level}", children=[element])
+
+        generator = XmlGenerator(schema=XsdSchema(root_elements=[element]), seed=42)
+        root = generator.generate()
+
+        assert len(list(root.iter())) == depth + 1
+        assert list(root.iter())[-1].text.isdigit()
+
+    def test_generate_skips_empty_optional_containers(self):
+        """Test that optional containers with no generated children are dropped."""
+        value = XsdElement(name="value", min_occurs=0, full_path="/root/outer/inner/value")
+        inner = XsdElement(name="inner", min_occurs=0, children=[value], full_path="/root/outer/inner")
+        outer = XsdElement(name="outer", min_occurs=0, children=[inner], full_path="/root/outer")
+        identifier = XsdElement(name="id", type_def=XsdSimpleType(base_type="integer"), full_path="/root/id")
+        root_def = XsdElement(name="root", children=[outer, identifier], full_path="/root")
+        generator = XmlGenerator(
+            schema=XsdSchema(root_elements=[root_def]),
+            distribution=DistributionConfig(
+                optional_field_fill_rate=1.0,
+                field_overrides={"/root/outer/inner/value": {"fill_rate": 0.0}},
+                seed=42,
+            ),
+            seed=42,
+        )
+        root = generator.generate()
+
+        assert [child.tag for child in root] == ["id"]
+
+
+    def test_single_occurrence_children_draw_no_repeat_count(self):
+        """Test that repeat counts are only drawn for elements that can repeat."""
+
+        class CountingDistribution(DistributionConfig):
+            def get_repeat_count(self, field_path, min_occurs=1, max_occurs=None):
+                self.counted.append(field_path)
+                return super().get_repeat_count(field_path, min_occurs, max_occurs)
+
+        distribution = CountingDistribution(seed=42)
+        distribution.counted = []
+        item = XsdElement(name="item", max_occurs=None, type_def=XsdSimpleType(), full_path="/root/item")
+        identifier = XsdElement(name="id", type_def=XsdSimpleType(), full_path="/root/id")
+        root_def = XsdElement(name="root", children=[identifier, item], full_path="/root")
+
+        generator = XmlGenerator(schema=XsdSchema(root_elements=[root_def]), distribution=distribution, seed=42)
+        root = generator.generate()
+
+        assert distribution.counted == ["/root/item"]
+        assert len(root.findall("id")) == 1
+
+    def test_repeated_elements_share_interned_tags(self, complex_schema_path):
+        """Test that every instance of an element reuses one interned tag string."""
+        schema = parse_xsd(complex_schema_path)
+        distribution = DistributionConfig(repeat_range=(2, 5), seed=42)
+        generator = XmlGenerator(schema=schema, distribution=distribution, seed=42)
+
+        first, second = generator.generate().findall("items/item")[:2]
+
+        assert first.tag is second.tag
+
+    def test_generate_attributes(self):
+        """Test that attributes are generated in schema order, honoring use and fixed values."""
+        root_def = XsdElement(
+            name="root",
+            type_def=XsdSimpleType(),
+            full_path="/root",
+            attributes=[
+                XsdAttribute(name="version", use="required", fixed="2"),
+                XsdAttribute(name="id", type_def=XsdSimpleType(base_type="integer"), use="required"),
+                XsdAttribute(name="note", use="optional"),
+            ],
+        )
+        schema = XsdSchema(root_elements=[root_def])
+
+        included = XmlGenerator(
+            schema=schema, distribution=DistributionConfig(optional_field_fill_rate=1.0, seed=42), seed=42
+        ).generate()
+        excluded = XmlGenerator(
+            schema=schema, distribution=DistributionConfig(optional_field_fill_rate=0.0, seed=42), seed=42
+        ).generate()
+
+        assert list(included.attrib) == ["version", "id", "note"]
+        assert included.get("version") == "2"
+        assert included.get("id").isdigit()
+        assert list(excluded.attrib) == ["version", "id"]
 
 class TestXmlValidator:
     """Tests for the XmlValidator class."""
@@ -328,6 +431,28 @@ class TestXmlValidator:
         assert validator.is_valid(valid_xml)
         assert not validator.is_valid(invalid_xml)
 
+    def test_validate_element(self, schema_path):
+        """Test validating an in-memory element tree."""
+        validator = XmlValidator(schema_path)
+
+        assert validator.validate_element(ET.fromstring("<root><required>test</required></root>")) == (True, [])
+
+        is_valid, errors = validator.validate_element(ET.fromstring("<root/>"))
+        assert not is_valid
+        assert len(errors) > 0
+
+    def test_schema_shared_until_file_changes(self, schema_path):
+        """Test that validators share a compiled schema until the XSD is modified."""
+        first = XmlValidator(schema_path)
+        second = XmlValidator(schema_path)
+
+        assert first.xml_schema is second.xml_schema
+
+        stat = schema_path.stat()
+        os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert XmlValidator(schema_path).xml_schema is not first.xml_schema
+
 
 class TestGenerateXmlFromXsd:
     """Tests for the generate_xml_from_xsd convenience function."""
@@ -413,6 +538,34 @@ class TestDistributionConfig:
         # Overridden field uses override rate
         assert config._get_field_fill_rate("/root/special") == 0.9
 
+    def test_partial_field_override_falls_back_to_defaults(self):
+        """Test that an override only replaces the settings it specifies."""
+        config = DistributionConfig(
+            optional_field_fill_rate=0.5,
+            null_rate=0.2,
+            repeat_range=(1, 3),
+            field_overrides={
+                "/root/items": {"repeatRange": [2, 4]},
+            },
+        )
+
+        assert config._get_field_repeat_range("/root/items") == (2, 4)
+        assert config._get_field_fill_rate("/root/items") == 0.5
+        assert config._get_field_null_rate("/root/items") == 0.2
+        assert config._get_field_repeat_range("/root/other") == (1, 3)
+
+    def test_default_changed_after_construction_applies(self):
+        """Test that adjusting a default later (as the runner's fill-rate override does) takes effect."""
+        config = DistributionConfig(
+            optional_field_fill_rate=0.5,
+            field_overrides={"/root/special": {"fillRate": 0.9}},
+        )
+
+        config.optional_field_fill_rate = 0.1
+
+        assert config._get_field_fill_rate("/root/normal") == 0.1
+        assert config._get_field_fill_rate("/root/special") == 0.9
+
     def test_get_repeat_count_within_bounds(self):
         """Test that repeat count respects XSD bounds."""
         config = DistributionConfig(
@@ -437,6 +590,19 @@ class TestDistributionConfig:
             count = config.get_repeat_count("/path", min_occurs=1, max_occurs=None)
             assert 1 <= count <= 5
 
+    def test_seeded_configs_are_independent_of_global_random(self):
+        """Test that a seeded config's decisions depend only on its own seed."""
+        first = DistributionConfig(seed=7)
+        random.seed(1)
+        random.random()
+        second = DistributionConfig(seed=7)
+        random.seed(2)
+
+        draws_first = [first.get_repeat_count("/p", 1, None) for _ in range(20)]
+        draws_second = [second.get_repeat_count("/p", 1, None) for _ in range(20)]
+
+        assert draws_first == draws_second
+
     def test_reproducible_with_seed(self):
         """Test that decisions produce valid boolean results."""
         config = DistributionConfig(seed=12345)
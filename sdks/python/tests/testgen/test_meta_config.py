@@ -39,6 +39,26 @@ context:
         finally:
             meta_path.unlink()
 
+    def test_load_utf8_config(self):
+        """Test that non-ASCII text is decoded as UTF-8."""
+        yaml_content = """
+context:
+  contextId: "café"
+  displayName: "Prêts – Québec"
+"""
+
+        with tempfile.NamedTemporaryFile(mode="wb", suffix=".meta.yaml", delete=False) as f:
+            f.write(yaml_content.encode("utf-8"))
+            meta_path = Path(f.name)
+
+        try:
+            config = load_meta_config(meta_path)
+
+            assert config.context.context_id == "café"
+            assert config.context.display_name == "Prêts – Québec"
+        finally:
+            meta_path.unlink()
+
     def test_load_full_config(self):
         """Test loading a complete meta config."""
         yaml_content = """
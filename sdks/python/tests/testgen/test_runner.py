@@ -0,0 +1,218 @@
+"""Tests for the test lane runner."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from testgen.api.client import SubmissionResult
+from testgen.generation.generator import XmlGenerator
+from testgen.runner import RunResult, TestLaneRunner as LaneRunner
+
+
+LANES_DIR = Path(__file__).resolve().parents[2] / "test_lanes"
+
+
+class RecordingClient:
+    """Stands in for TestGenApiClient, recording submissions and their overlap."""
+
+    def __init__(self, fail_indexes: set[int] | None = None, delay: float = 0.0):
+        self.fail_indexes = fail_indexes or set()
+        self.delay = delay
+        self.submitted: list[str] = []
+        self.metadata: list[dict[str, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def ensure_context_exists(self, config) -> bool:
+        return True
+
+    def submit_xml_observations(self, context_id, xml_content, metadata) -> SubmissionResult:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            index = len(self.submitted)
+            self.submitted.append(context_id)
+            self.metadata.append(metadata)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        if index in self.fail_indexes:
+            return SubmissionResult(success=False, observation_count=0, error_message="boom")
+        return SubmissionResult(success=True, observation_count=3)
+
+
+@pytest.fixture
+def lane():
+    runner = LaneRunner(LANES_DIR)
+    return next(l for l in runner.discover_lanes() if l.name == "profile")
+
+
+class TestRunLane:
+    """Tests for generating and submitting one lane."""
+
+    def test_submissions_are_serialized_per_lane(self, lane):
+        """Test that every document is submitted with at most one request in flight."""
+        runner = LaneRunner(LANES_DIR, count=5, seed=1)
+        client = RecordingClient(delay=0.01)
+
+        result = runner._run_lane(lane, client)
+
+        assert result.errors == []
+        assert result.total_generated == 5
+        assert result.total_submitted == 5
+        assert result.total_observations == 15
+        assert client.submitted == ["customer"] * 5
+        assert client.max_in_flight == 1
+
+    def test_failed_submission_is_reported_with_its_index(self, lane):
+        """Test that a failure is attributed to the document that caused it."""
+        runner = LaneRunner(LANES_DIR, count=3, seed=1)
+        client = RecordingClient(fail_indexes={1})
+
+        result = runner._run_lane(lane, client)
+
+        assert result.errors == ["XML 2 submission failed: boom"]
+        assert result.total_submitted == 2
+        assert result.total_observations == 6
+
+    def test_interrupted_lane_collects_submission_and_stops_submitter(self, lane, monkeypatch):
+        """Test that a loop escaping mid-lane still collects the in-flight submission."""
+
+        class Abort(BaseException):
+            pass
+
+        real_generate = XmlGenerator.generate
+        calls = []
+
+        def generate_then_abort(self):
+            calls.append(1)
+            if len(calls) == 2:
+                raise Abort()
+            return real_generate(self)
+
+        monkeypatch.setattr(XmlGenerator, "generate", generate_then_abort)
+        runner = LaneRunner(LANES_DIR, count=3, seed=1)
+        client = RecordingClient(delay=0.05)
+
+        with pytest.raises(Abort):
+            runner._run_lane(lane, client)
+
+        assert client.submitted == ["customer"]
+        assert client.in_flight == 0
+        assert not any(t.name.startswith("testgen-submit") for t in threading.enumerate())
+
+    def test_each_document_draws_its_own_metadata(self, lane):
+        """Test that every document gets a fresh dict with one value per metadata key."""
+        runner = LaneRunner(LANES_DIR, count=20, seed=1)
+        client = RecordingClient()
+
+        runner._run_lane(lane, client)
+
+        optional = lane.meta_config.context.optional_metadata
+        required = lane.meta_config.context.required_metadata
+        assert len(client.metadata) == 20
+        assert len({id(m) for m in client.metadata}) == 20
+        for metadata in client.metadata:
+            assert set(metadata) == set(required) | set(optional)
+            assert metadata["documenttype"] in required["documenttype"]
+            for key, values in optional.items():
+                assert metadata[key] in values
+        assert len({m["region"] for m in client.metadata}) > 1
+
+
+class TestRunLanes:
+    """Tests for running several lanes."""
+
+    @pytest.fixture
+    def lanes(self):
+        return LaneRunner(LANES_DIR).discover_lanes()
+
+    def test_selected_lanes_are_matched_once_in_order(self, monkeypatch, capsys):
+        """Test that lane names select by substring, without duplicates."""
+        runner = LaneRunner(LANES_DIR, dry_run=True)
+        selected: list[str] = []
+
+        def record(lanes):
+            selected.extend(l.full_name for l in lanes)
+            return RunResult(len(lanes), len(lanes), 0, 0, [])
+
+        monkeypatch.setattr(runner, "_run_lanes", record)
+
+        exit_code = runner.run_lanes(["auto", "profile", "customer/profile", "missing"])
+
+        assert exit_code == 0
+        assert selected == ["loans/auto_basic", "customer/profile"]
+        assert "No lane matching 'missing'" in capsys.readouterr().err
+
+    def test_concurrent_lanes_keep_lane_order(self, lanes):
+        """Test that results come back in lane order when lanes run concurrently."""
+        runner = LaneRunner(LANES_DIR, count=3, seed=1, dry_run=True, jobs=2)
+
+        result = runner._run_lanes(lanes)
+
+        assert [r.lane_name for r in result.lane_results] == [l.full_name for l in lanes]
+        assert result.total_xmls_generated == 3 * len(lanes)
+        assert result.success
+
+    def test_lanes_sharing_a_context_are_not_concurrent(self, lane):
+        """Test that one context never has two submissions in flight across lanes."""
+        runner = LaneRunner(LANES_DIR, count=3, seed=1, jobs=4)
+        client = RecordingClient(delay=0.01)
+
+        results = runner._run_lanes_concurrently([lane, lane], client)
+
+        assert [r.total_submitted for r in results] == [3, 3]
+        assert client.max_in_flight == 1
+
+    def test_seeded_metadata_does_not_depend_on_jobs(self, lanes):
+        """Test that a seeded lane draws the same metadata run alone or concurrently."""
+
+        def metadata_by_context(jobs):
+            runner = LaneRunner(LANES_DIR, count=5, seed=7, jobs=jobs)
+            client = RecordingClient()
+            if jobs > 1:
+                runner._run_lanes_concurrently(lanes, client)
+            else:
+                for lane in lanes:
+                    runner._run_lane(lane, client)
+            by_context: dict[str, list[dict[str, str]]] = {}
+            for context_id, metadata in zip(client.submitted, client.metadata):
+                by_context.setdefault(context_id, []).append(metadata)
+            return by_context
+
+        assert metadata_by_context(1) == metadata_by_context(2)
+
+
+class TestOutput:
+    """Tests for what the runner serializes and saves."""
+
+    def test_saved_documents_are_pretty_printed(self, lane, tmp_path):
+        """Test that documents written to the output directory are indented."""
+        runner = LaneRunner(LANES_DIR, count=2, seed=1, dry_run=True, output_dir=tmp_path)
+
+        result = runner._run_lane(lane, None)
+
+        files = sorted((tmp_path / lane.full_name).glob("*.xml"))
+        assert result.errors == []
+        assert [f.name for f in files] == ["profile_0001.xml", "profile_0002.xml"]
+        content = files[0].read_text(encoding="utf-8")
+        assert content.startswith('<?xml version="1.0" encoding="UTF-8"?>\n')
+        assert "\n  <" in content
+
+    def test_submitted_documents_are_compact(self, lane):
+        """Test that documents that are only submitted skip indentation."""
+        runner = LaneRunner(LANES_DIR, count=2, seed=1)
+        documents: list[str] = []
+
+        class Client(RecordingClient):
+            def submit_xml_observations(self, context_id, xml_content, metadata):
+                documents.append(xml_content)
+                return super().submit_xml_observations(context_id, xml_content, metadata)
+
+        runner._run_lane(lane, Client())
+
+        assert len(documents) == 2
+        assert all("\n  <" not in d for d in documents)
@@ -1,10 +1,16 @@
 """Tests for the value generator module."""
 
+import random
 import re
 
 import pytest
 
-from testgen.generation.values import ValueGeneratorRegistry, XsdTypeValueGenerator
+from testgen.generation.values import (
+    ValueGeneratorRegistry,
+    XsdTypeValueGenerator,
+    _alphabet_table,
+    _random_chars,
+)
 from testgen.xsd.model import XsdSimpleType
 
 
@@ -27,6 +33,17 @@ class TestValueGeneratorRegistry:
         assert isinstance(value, str)
         assert len(value) > 0
 
+    def test_generate_names_from_faker_tables(self):
+        """Test that names are drawn from Faker's name tables, reproducibly per seed."""
+        first = ValueGeneratorRegistry(seed=42)
+        second = ValueGeneratorRegistry(seed=42)
+        provider = first.faker.first_name.__self__
+
+        names = [first.generate("person.first_name") for _ in range(20)]
+
+        assert all(name in provider.first_names for name in names)
+        assert names == [second.generate("person.first_name") for _ in range(20)]
+
     def test_generate_email(self):
         """Test generating an email address."""
         registry = ValueGeneratorRegistry(seed=42)
@@ -116,6 +133,24 @@ class TestValueGeneratorRegistry:
         assert isinstance(value, str)
         assert len(value) == 17
 
+    def test_generate_codes_use_their_alphabets(self):
+        """Test that VINs and codes only use characters from their alphabets."""
+        registry = ValueGeneratorRegistry(seed=42)
+
+        for _ in range(50):
+            assert re.fullmatch(r"[A-HJ-NPR-Z0-9]{17}", registry.generate("vehicle.vin"))
+            assert re.fullmatch(r"[A-Z]{6}", registry.generate("code.alpha"))
+            assert re.fullmatch(r"[0-9]{8}", registry.generate("code.numeric"))
+            assert re.fullmatch(r"[A-Z0-9]{8}", registry.generate("code.alphanumeric"))
+
+    def test_random_chars_cover_alphabet_evenly(self):
+        """Test that random characters are spread evenly over the alphabet."""
+        chars = _random_chars(random.Random(7), _alphabet_table("abc"), 30000)
+
+        assert len(chars) == 30000
+        assert all(9500 < chars.count(c) < 10500 for c in "abc")
+        assert _random_chars(random.Random(7), _alphabet_table("abc"), 0) == ""
+
     def test_generate_decimal_parameterized(self):
         """Test generating a parameterized decimal."""
         registry = ValueGeneratorRegistry(seed=42)
@@ -178,6 +213,23 @@ class TestValueGeneratorRegistry:
         assert isinstance(value, str)
         assert re.match(r"[A-Z]{3}-\d{3}", value)
 
+    def test_generate_pattern_reuses_date_parts(self):
+        """Test that repeated date placeholders in one pattern share a single draw."""
+        registry = ValueGeneratorRegistry(seed=42)
+
+        for _ in range(20):
+            value = registry.generate("pattern:{YYYY}/{YY}-{MM}{MM}-{seq:3}")
+            match = re.fullmatch(r"(\d{4})/(\d{2})-(\d{2})(\d{2})-\d{3}", value)
+            assert match
+            assert match.group(1)[2:] == match.group(2)
+            assert match.group(3) == match.group(4)
+
+    def test_generate_pattern_keeps_unknown_braces(self):
+        """Test that text that isn't a placeholder is copied through."""
+        registry = ValueGeneratorRegistry(seed=42)
+
+        assert registry.generate("pattern:{#x}-{AB}") == "{#x}-{AB}"
+
     def test_generate_unknown_type_fallback(self):
         """Test that unknown types fall back to random string."""
         registry = ValueGeneratorRegistry(seed=42)
@@ -186,6 +238,14 @@ class TestValueGeneratorRegistry:
         assert isinstance(value, str)
         assert len(value) > 0
 
+    def test_resolve_matches_generate(self):
+        """Test that a resolved generator draws the same values as generate()."""
+        for semantic_type in ("integer(1, 1000)", "pattern:ACC-{######}", "vehicle.make"):
+            resolved = ValueGeneratorRegistry(seed=42).resolve(semantic_type)
+            direct = ValueGeneratorRegistry(seed=42)
+
+            assert [resolved() for _ in range(5)] == [direct.generate(semantic_type) for _ in range(5)]
+
     def test_has_semantic_type_registered(self):
         """Test checking if semantic type is registered."""
         registry = ValueGeneratorRegistry(seed=42)
@@ -196,6 +256,13 @@ class TestValueGeneratorRegistry:
         assert registry.has_semantic_type("pattern:ABC")  # Pattern
         assert not registry.has_semantic_type("nonexistent.type")
 
+    def test_all_registered_types_generate_strings(self):
+        """Test that every built-in semantic type yields a string value."""
+        registry = ValueGeneratorRegistry(seed=42)
+
+        for semantic_type in registry._generators:
+            assert isinstance(registry.generate(semantic_type), str), semantic_type
+
     def test_reproducible_with_seed(self):
         """Test that integer generation produces valid values within range."""
         # Note: Faker's string generation isn't perfectly reproducible across instances
@@ -251,6 +318,15 @@ class TestXsdTypeValueGenerator:
         num = float(value)
         assert 100.0 <= num <= 200.0
 
+    def test_generate_decimal_fraction_digits(self):
+        """Test that decimals carry exactly the schema's fraction digits."""
+        generator = XsdTypeValueGenerator(seed=42)
+
+        assert re.fullmatch(r"\d+", generator.generate(XsdSimpleType(base_type="decimal", fraction_digits=0)))
+        for digits in (2, 9, 12):
+            value = generator.generate(XsdSimpleType(base_type="decimal", fraction_digits=digits))
+            assert len(value.split(".")[1]) == digits
+
     def test_generate_string_with_length(self):
         """Test generating a string with length constraints."""
         generator = XsdTypeValueGenerator(seed=42)
@@ -279,6 +355,35 @@ class TestXsdTypeValueGenerator:
         value = generator.generate(type_def)
         assert value in ("true", "false")
 
+    def test_generate_base_type_is_case_insensitive(self):
+        """Test that mixed-case base types dispatch like their lower-case form."""
+        generator = XsdTypeValueGenerator(seed=42)
+
+        assert re.match(r"\d{4}-\d{2}-\d{2}T", generator.generate(XsdSimpleType(base_type="dateTime")))
+        assert generator.generate(XsdSimpleType(base_type="Integer")).isdigit()
+
+    def test_generate_from_simple_patterns(self):
+        """Test generating from simple character-class patterns."""
+        generator = XsdTypeValueGenerator(seed=42)
+
+        for _ in range(2):
+            assert re.fullmatch(r"[A-Z]{3}", generator.generate(XsdSimpleType(pattern="[A-Z]{3}")))
+            assert re.fullmatch(r"[0-9]{5}", generator.generate(XsdSimpleType(pattern="[0-9]{5}")))
+
+    def test_resolve_matches_generate(self):
+        """Test that a resolved generator draws the same values as generate()."""
+        type_defs = [
+            XsdSimpleType(base_type="integer", min_value=0, max_value=1000),
+            XsdSimpleType(base_type="decimal"),
+            XsdSimpleType(enumeration=["A", "B", "C"]),
+            XsdSimpleType(pattern="[0-9]{5}"),
+        ]
+        for type_def in type_defs:
+            resolved = XsdTypeValueGenerator(seed=42).resolve(type_def)
+            direct = XsdTypeValueGenerator(seed=42)
+
+            assert [resolved() for _ in range(5)] == [direct.generate(type_def) for _ in range(5)]
+
     def test_generate_none_type(self):
         """Test generating when type_def is None."""
         generator = XsdTypeValueGenerator(seed=42)
@@ -302,3 +407,17 @@ class TestXsdTypeValueGenerator:
 
         for value in values:
             assert value in ("A", "B", "C", "D", "E")
+
+    def test_seeded_generators_are_independent_of_global_random(self):
+        """Test that a seeded generator's draws depend only on its own seed."""
+        first = XsdTypeValueGenerator(seed=7)
+        random.seed(1)
+        second = XsdTypeValueGenerator(seed=7)
+        random.seed(2)
+
+        type_def = XsdSimpleType(base_type="integer", min_value=0, max_value=10**6)
+
+        draws_first = [first.generate(type_def) for _ in range(20)]
+        draws_second = [second.generate(type_def) for _ in range(20)]
+
+        assert draws_first == draws_second
@@ -5,7 +5,8 @@ from pathlib import Path
 
 import pytest
 
-from testgen.xsd.parser import parse_xsd, extract_field_paths
+from testgen.xsd.parser import parse_xsd, extract_field_paths, load_xml_schema
+from testgen.generation.generator import XmlValidator
 from testgen.xsd.model import XsdSchema, XsdElement
 
 
@@ -242,6 +243,27 @@ class TestParseXsd:
         with pytest.raises(FileNotFoundError):
             parse_xsd(Path("/nonexistent/path/schema.xsd"))
 
+    def test_parse_shares_compiled_schema_with_validator(self):
+        """Test that parsing and validating one XSD compile it only once."""
+        xsd_content = """<?xml version="1.0" encoding="UTF-8"?>
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:element name="root" type="xs:string"/>
+        </xs:schema>
+        """
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".xsd", delete=False) as f:
+            f.write(xsd_content)
+            xsd_path = Path(f.name)
+
+        try:
+            compiled = load_xml_schema(xsd_path)
+            parse_xsd(xsd_path)
+
+            assert XmlValidator(xsd_path).xml_schema is compiled
+            assert load_xml_schema(xsd_path) is compiled
+        finally:
+            xsd_path.unlink()
+
 
 class TestExtractFieldPaths:
     """Tests for the extract_field_paths function."""